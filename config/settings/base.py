@@ -1,4 +1,5 @@
 # config/settings/base.py
+import importlib.util
 import os
 from pathlib import Path
 import environ
@@ -186,6 +187,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'core.pagination.CustomPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': [
@@ -207,6 +212,10 @@ REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'core.exceptions.custom_exception_handler',
 }
 
+# Offer msgpack responses to internal callers when the encoder is installed
+if importlib.util.find_spec('msgpack') is not None:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].insert(1, 'core.renderers.MessagePackRenderer')
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Your API',
     'DESCRIPTION': 'Your project description',
@@ -246,6 +255,30 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Analytics and notification tasks declare their own queues, so bursts of
+# them never wait in front of idea generation on the default queue. Run a
+# worker per queue, e.g.:
+#   celery -A config worker -Q celery -c 8
+#   celery -A config worker -Q analytics -c 4 --prefetch-multiplier 4
+#   celery -A config worker -Q notifications -c 2
+CELERY_BEAT_SCHEDULE = {
+    'drain-idea-interactions': {
+        'task': 'ideas.tasks.drain_interactions',
+        'schedule': 5.0,  # seconds
+    },
+    'sync-daily-unique-users': {
+        'task': 'ideas.tasks.sync_daily_unique_users',
+        'schedule': 60.0,  # seconds
+    },
+    'sweep-feedback-reminders': {
+        'task': 'ideas.tasks.sweep_feedback_reminders',
+        'schedule': 60.0,  # seconds
+    },
+    'refresh-popular-templates': {
+        'task': 'ideas.tasks.refresh_popular_templates',
+        'schedule': 60 * 60,  # hourly
+    },
+}
 
 # Auto-discover tasks
 CELERY_AUTODISCOVER_TASKS = True
@@ -0,0 +1,72 @@
+# apps/core/renderers.py
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Try to import orjson, fallback to the stdlib-based JSONRenderer if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available, ORJSONRenderer will use the stdlib json encoder")
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson for faster encoding of API responses.
+    Types orjson cannot encode natively (Decimal, lazy strings, ...) are
+    handed to DRF's own encoder so the output matches JSONRenderer.
+    Datetimes go to DRF's encoder too: it trims them to milliseconds and
+    writes UTC as "Z", where orjson would keep the microseconds.
+    """
+
+    _encoder = encoders.JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not ORJSON_AVAILABLE or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        ret = orjson.dumps(
+            data,
+            default=self._encoder.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+        # Escaped by JSONRenderer too, they end a line in JavaScript
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+# Try to import msgpack, the renderer is only registered when it is installed
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack renderer for internal / service-to-service callers that
+    send ``Accept: application/msgpack``. Browsers keep getting JSON.
+    """
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    _encoder = encoders.JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return msgpack.packb(data, default=self._encoder.default, use_bin_type=True)
@@ -1,3 +1,43 @@
-from django.test import TestCase
+import datetime
+import uuid
+from decimal import Decimal
+from unittest import skipUnless
 
-# Create your tests here.
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from .renderers import ORJSON_AVAILABLE, ORJSONRenderer
+
+
+@skipUnless(ORJSON_AVAILABLE, 'orjson is not installed')
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer writes the same bytes as DRF's JSONRenderer"""
+
+    def assertRendersLikeJSONRenderer(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_datetimes(self):
+        self.assertRendersLikeJSONRenderer({
+            'utc': datetime.datetime(2026, 10, 17, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'offset': datetime.datetime(
+                2026, 10, 17, 9, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+            ),
+            'naive': datetime.datetime(2026, 10, 17, 9, 30, 15, 500),
+            'date': datetime.date(2026, 10, 17),
+        })
+
+    def test_fallback_types(self):
+        self.assertRendersLikeJSONRenderer({
+            'price': Decimal('4.50'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'label': gettext_lazy('Anniversary'),
+            'counts': {1: 2},
+            'items': [1, 2.5, None, True, 'café'],
+        })
+
+    def test_line_separators_are_escaped(self):
+        self.assertRendersLikeJSONRenderer({'note': 'first\u2028second\u2029third'})
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
@@ -36,11 +36,23 @@ def verify_webhook_signature(payload: str, signature: str, secret: str) -> bool:
         return False
 
 def get_client_ip(request) -> str:
-    """Get client IP address from request"""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        return x_forwarded_for.split(',')[0].strip()
-    return request.META.get('REMOTE_ADDR', '')
+    """
+    Get client IP address from request
+    
+    The result is memoized on the underlying HttpRequest so middleware,
+    serializers and views share a single lookup per request.
+    """
+    http_request = getattr(request, '_request', request)
+    ip = getattr(http_request, '_cached_client_ip', None)
+    if ip is None:
+        meta = http_request.META
+        x_forwarded_for = meta.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            ip = x_forwarded_for.partition(',')[0].strip()
+        else:
+            ip = meta.get('REMOTE_ADDR', '')
+        http_request._cached_client_ip = ip
+    return ip
 
 def cache_key(prefix: str, *args) -> str:
     """Generate cache key with prefix and arguments"""
@@ -1,4 +1,5 @@
 # apps/ideas/ai_client.py
+import hashlib
 import logging
 import json
 import time
@@ -106,7 +107,8 @@ class AIClient:
         max_tokens: int = 1500,
         user_id: int = None,
         system_prompt: str = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        json_mode: bool = False
     ) -> Dict[str, Any]:
         """
         Generate AI completion for given prompt
@@ -119,6 +121,7 @@ class AIClient:
             user_id: User ID for rate limiting and analytics
             system_prompt: System prompt for context
             use_cache: Whether to use cached responses
+            json_mode: Ask the provider to return a JSON object
             
         Returns:
             Dict containing AI response data
@@ -157,11 +160,11 @@ class AIClient:
             # Generate completion based on provider
             if model == 'deepseek':
                 response = self._generate_deepseek_completion(
-                    prompt, temperature, max_tokens, system_prompt, provider_config
+                    prompt, temperature, max_tokens, system_prompt, provider_config, json_mode
                 )
             elif model == 'openai':
                 response = self._generate_openai_completion(
-                    prompt, temperature, max_tokens, system_prompt, provider_config
+                    prompt, temperature, max_tokens, system_prompt, provider_config, json_mode
                 )
             else:
                 raise AIProviderError(f"Unsupported AI provider: {model}")
@@ -188,7 +191,7 @@ class AIClient:
             if model != 'openai' and 'openai' in self.providers:
                 logger.info("Attempting fallback to OpenAI")
                 return self.generate_completion(
-                    prompt, 'openai', temperature, max_tokens, user_id, system_prompt, use_cache
+                    prompt, 'openai', temperature, max_tokens, user_id, system_prompt, use_cache, json_mode
                 )
             raise ServiceUnavailableError(f"AI service unavailable: {str(e)}")
         except Exception as e:
@@ -233,11 +236,33 @@ class AIClient:
         cache_key = self._generate_cache_key(prompt, model, temperature)
         cache.set(cache_key, response, self.cache_timeout)
     
+    def get_cached_responses(self, prompts: List[str], model: str = None, temperature: float = 0.7) -> Dict[str, Dict]:
+        """Get cached responses for several prompts in one cache round trip"""
+        model = model if model in self.providers else self.default_provider
+        cache_keys = {
+            self._generate_cache_key(prompt, model, temperature): prompt
+            for prompt in prompts
+        }
+        cached = cache.get_many(list(cache_keys))
+        return {cache_keys[key]: response for key, response in cached.items()}
+    
+    def cache_responses(self, responses: Dict[str, Dict], model: str = None, temperature: float = 0.7) -> None:
+        """Cache responses for several prompts in one cache round trip"""
+        if not responses:
+            return
+        model = model if model in self.providers else self.default_provider
+        cache.set_many(
+            {
+                self._generate_cache_key(prompt, model, temperature): response
+                for prompt, response in responses.items()
+            },
+            self.cache_timeout
+        )
+    
     def _generate_cache_key(self, prompt: str, model: str, temperature: float) -> str:
         """Generate cache key for response caching"""
-        import hashlib
         content = f"{prompt}_{model}_{temperature}"
-        hash_key = hashlib.md5(content.encode()).hexdigest()
+        hash_key = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
         return f"{self.response_cache_prefix}_{hash_key}"
     
     def _generate_deepseek_completion(
@@ -246,7 +271,8 @@ class AIClient:
         temperature: float,
         max_tokens: int,
         system_prompt: Optional[str],
-        config: AIModelConfig
+        config: AIModelConfig,
+        json_mode: bool = False
     ) -> Dict[str, Any]:
         """Generate completion using DeepSeek (Ollama) API"""
         start_time = time.time()
@@ -268,6 +294,8 @@ class AIClient:
                 'repeat_penalty': 1.1,
             }
         }
+        if json_mode:
+            payload['format'] = 'json'
         
         headers = {
             'Content-Type': 'application/json',
@@ -306,7 +334,8 @@ class AIClient:
                 'usage': usage,
                 'response_time': response_time,
                 'timestamp': timezone.now(),
-                'raw_response': response_data
+                'raw_response': response_data,
+                '_raw': response.text
             }
             
         except requests.exceptions.Timeout:
@@ -331,7 +360,8 @@ class AIClient:
         temperature: float,
         max_tokens: int,
         system_prompt: Optional[str],
-        config: AIModelConfig
+        config: AIModelConfig,
+        json_mode: bool = False
     ) -> Dict[str, Any]:
         """Generate completion using OpenAI API"""
         start_time = time.time()
@@ -351,6 +381,8 @@ class AIClient:
             'frequency_penalty': 0,
             'presence_penalty': 0
         }
+        if json_mode:
+            payload['response_format'] = {'type': 'json_object'}
         
         headers = {
             'Content-Type': 'application/json',
@@ -380,7 +412,8 @@ class AIClient:
                 'usage': usage,
                 'response_time': response_time,
                 'timestamp': timezone.now(),
-                'raw_response': response_data
+                'raw_response': response_data,
+                '_raw': response.text
             }
             
         except requests.exceptions.Timeout:
@@ -409,6 +442,10 @@ class AIClient:
             f"Response time: {response.get('response_time', 0):.2f}s"
         )
     
+    def is_service_available(self) -> bool:
+        """Check that at least one AI provider is configured"""
+        return bool(self.providers)
+    
     def get_available_models(self) -> List[Dict[str, Any]]:
         """Get list of available AI models"""
         models = []
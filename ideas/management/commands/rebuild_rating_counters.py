@@ -0,0 +1,12 @@
+# apps/ideas/management/commands/rebuild_rating_counters.py
+from django.core.management.base import BaseCommand
+
+from ideas.services import IdeaRatingService
+
+
+class Command(BaseCommand):
+    help = "Recompute every idea's rating_sum, rating_count and user_rating from its feedback"
+    
+    def handle(self, *args, **options):
+        updated = IdeaRatingService.rebuild_rating_counters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rating counters for {updated} ideas"))
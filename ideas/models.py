@@ -6,7 +6,7 @@ from django.utils import timezone
 from core.models import BaseModel, SoftDeleteModel
 from decimal import Decimal
 import uuid
-from .managers import IdeaRequestManager, GeneratedIdeaManager, IdeaTemplateManager
+from .managers import IdeaRequestManager, GeneratedIdeaManager, IdeaTemplateManager, IdeaFeedbackManager
 
 User = get_user_model()
 
@@ -81,7 +81,7 @@ class IdeaTemplate(BaseModel):
     def increment_usage(self):
         """Increment usage count"""
         self.usage_count += 1
-        self.save(update_fields=['usage_count'])
+        IdeaTemplate.objects.filter(pk=self.pk).update(usage_count=models.F('usage_count') + 1)
 
 class IdeaRequest(BaseModel, SoftDeleteModel):
     """
@@ -239,6 +239,11 @@ class GeneratedIdea(BaseModel):
     like_count = models.IntegerField(default=0)
     share_count = models.IntegerField(default=0)
     pdf_download_count = models.IntegerField(default=0)
+    engagement_score = models.GeneratedField(  # Stored for trending ideas
+        expression=models.F('like_count') * 2 + models.F('view_count') + models.F('share_count') * 3,
+        output_field=models.IntegerField(),
+        db_persist=True
+    )
     
     # Quality scores
     content_quality_score = models.FloatField(null=True, blank=True)  # Internal quality assessment
@@ -249,6 +254,8 @@ class GeneratedIdea(BaseModel):
         blank=True,
         validators=[MinValueValidator(Decimal('1.00')), MaxValueValidator(Decimal('5.00'))]
     )
+    rating_sum = models.PositiveIntegerField(default=0)  # Denormalized for user_rating
+    rating_count = models.PositiveIntegerField(default=0)
     
     objects = GeneratedIdeaManager()
     
@@ -258,8 +265,12 @@ class GeneratedIdea(BaseModel):
         verbose_name_plural = 'Generated Ideas'
         indexes = [
             models.Index(fields=['request', 'created_at']),
+            models.Index(fields=['request', 'template_used']),
             models.Index(fields=['user_rating']),
             models.Index(fields=['view_count']),
+            models.Index(fields=['-engagement_score', 'created_at']),
+            models.Index(fields=['-user_rating', '-like_count', '-id']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -268,22 +279,22 @@ class GeneratedIdea(BaseModel):
     def increment_view_count(self):
         """Increment view count"""
         self.view_count += 1
-        self.save(update_fields=['view_count'])
+        GeneratedIdea.objects.filter(pk=self.pk).update(view_count=models.F('view_count') + 1)
     
     def increment_like_count(self):
         """Increment like count"""
         self.like_count += 1
-        self.save(update_fields=['like_count'])
+        GeneratedIdea.objects.filter(pk=self.pk).update(like_count=models.F('like_count') + 1)
     
     def increment_share_count(self):
         """Increment share count"""
         self.share_count += 1
-        self.save(update_fields=['share_count'])
+        GeneratedIdea.objects.filter(pk=self.pk).update(share_count=models.F('share_count') + 1)
     
     def increment_pdf_download_count(self):
         """Increment PDF download count"""
         self.pdf_download_count += 1
-        self.save(update_fields=['pdf_download_count'])
+        GeneratedIdea.objects.filter(pk=self.pk).update(pdf_download_count=models.F('pdf_download_count') + 1)
 
 class IdeaFeedback(BaseModel):
     """
@@ -318,6 +329,8 @@ class IdeaFeedback(BaseModel):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True)
     
+    objects = IdeaFeedbackManager()
+    
     class Meta:
         db_table = 'idea_feedback'
         verbose_name = 'Idea Feedback'
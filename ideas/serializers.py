@@ -1,17 +1,46 @@
 # apps/ideas/serializers.py
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from rest_framework.validators import ValidationError
 from django.contrib.auth import get_user_model
+from django.db import models
 from django.utils import timezone
 from .models import (
     IdeaCategory, IdeaTemplate, IdeaRequest, GeneratedIdea, 
     IdeaFeedback, IdeaBookmark, IdeaUsageStats, AIModelConfiguration
 )
+from core.utils import get_client_ip
 from .validators import validate_idea_request_data
 
 User = get_user_model()
 
 
+class FastListSerializer(serializers.ListSerializer):
+    """
+    List serializer that binds the child's readable fields once per list
+    and serializes every row in a single tight loop
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        fields = [(field.field_name, field) for field in self.child._readable_fields]
+        
+        ret = []
+        for instance in iterable:
+            row = {}
+            for name, field in fields:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                row[name] = None if check_for_none is None else field.to_representation(attribute)
+            ret.append(row)
+        return ret
+
+
 class IdeaCategorySerializer(serializers.ModelSerializer):
     """Serializer for IdeaCategory model"""
     
@@ -24,18 +53,45 @@ class IdeaCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class IdeaTemplateListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for template listings"""
+# Formatting helpers for serializers that build their rows by hand
+_DATETIME_FIELD = serializers.DateTimeField(read_only=True)
+
+
+class IdeaTemplateListSerializer(serializers.Serializer):
+    """
+    Lightweight serializer for template listings
+    
+    Hand-written rather than a ModelSerializer since the template list is a
+    hot read path; to_representation builds each row directly.
+    """
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    slug = serializers.SlugField(read_only=True)
+    template_type = serializers.CharField(read_only=True)
     category_name = serializers.CharField(source='category.name', read_only=True)
     category_icon = serializers.CharField(source='category.icon', read_only=True)
+    description = serializers.CharField(read_only=True)
+    is_premium = serializers.BooleanField(read_only=True)
+    usage_count = serializers.IntegerField(read_only=True)
+    average_rating = serializers.DecimalField(max_digits=3, decimal_places=2, read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
     
-    class Meta:
-        model = IdeaTemplate
-        fields = [
-            'id', 'name', 'slug', 'template_type', 'category_name', 
-            'category_icon', 'description', 'is_premium', 'usage_count', 
-            'average_rating', 'created_at'
-        ]
+    def to_representation(self, obj):
+        category = obj.category
+        fields = self.fields
+        return {
+            'id': str(obj.id),
+            'name': obj.name,
+            'slug': obj.slug,
+            'template_type': obj.template_type,
+            'category_name': category.name,
+            'category_icon': category.icon,
+            'description': obj.description,
+            'is_premium': obj.is_premium,
+            'usage_count': obj.usage_count,
+            'average_rating': fields['average_rating'].to_representation(obj.average_rating),
+            'created_at': fields['created_at'].to_representation(obj.created_at),
+        }
 
 
 class IdeaTemplateDetailSerializer(serializers.ModelSerializer):
@@ -93,25 +149,22 @@ class IdeaRequestCreateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         """Create request with user from context"""
-        user = self.context['request'].user
-        validated_data['user'] = user
-        
-        # Set metadata
         request = self.context['request']
-        validated_data['ip_address'] = self.get_client_ip(request)
-        validated_data['user_agent'] = request.META.get('HTTP_USER_AGENT', '')
-        validated_data['session_id'] = request.session.session_key or ''
+        session = getattr(request, 'session', None)
+        
+        # Set user and metadata in one pass
+        validated_data.update(
+            user=request.user,
+            ip_address=get_client_ip(request),
+            user_agent=request.META.get('HTTP_USER_AGENT', ''),
+            session_id=getattr(session, 'session_key', None) or ''
+        )
         
         return super().create(validated_data)
     
     def get_client_ip(self, request):
         """Get client IP address"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
+        return get_client_ip(request)
 
 
 class GeneratedIdeaSerializer(serializers.ModelSerializer):
@@ -132,6 +185,7 @@ class GeneratedIdeaSerializer(serializers.ModelSerializer):
         read_only_fields = [
             'id', 'view_count', 'like_count', 'share_count', 'created_at'
         ]
+        list_serializer_class = FastListSerializer
     
     def get_user_feedback(self, obj):
         """Get current user's feedback for this idea"""
@@ -139,18 +193,19 @@ class GeneratedIdeaSerializer(serializers.ModelSerializer):
         if not request or not request.user.is_authenticated:
             return None
         
-        try:
-            feedback = IdeaFeedback.objects.get(
-                user=request.user,
-                idea=obj,
-                feedback_type='rating'
-            )
-            return {
-                'rating': feedback.rating,
-                'created_at': feedback.created_at
-            }
-        except IdeaFeedback.DoesNotExist:
+        feedback = IdeaFeedback.objects.filter(
+            user=request.user,
+            idea=obj,
+            feedback_type='rating'
+        ).only('rating', 'created_at').first()
+        
+        if feedback is None:
             return None
+        
+        return {
+            'rating': feedback.rating,
+            'created_at': feedback.created_at
+        }
     
     def get_is_bookmarked(self, obj):
         """Check if idea is bookmarked by current user"""
@@ -188,6 +243,35 @@ class IdeaRequestSerializer(serializers.ModelSerializer):
         return obj.get_processing_time()
 
 
+def _validate_rating_feedback(attrs):
+    """Rating feedback requires a rating between 1 and 5"""
+    rating = attrs.get('rating')
+    if not rating:
+        raise ValidationError("Rating is required for rating feedback")
+    if not 1 <= rating <= 5:
+        raise ValidationError("Rating must be between 1 and 5")
+
+
+def _validate_comment_feedback(attrs):
+    """Comment feedback requires a comment"""
+    if not attrs.get('comment'):
+        raise ValidationError("Comment is required for comment feedback")
+
+
+def _validate_report_feedback(attrs):
+    """Report feedback requires a reason"""
+    if not attrs.get('report_reason'):
+        raise ValidationError("Report reason is required for report feedback")
+
+
+# Per-type feedback validation, looked up once per request
+_FEEDBACK_VALIDATORS = {
+    'rating': _validate_rating_feedback,
+    'comment': _validate_comment_feedback,
+    'report': _validate_report_feedback,
+}
+
+
 class IdeaFeedbackCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating idea feedback"""
     
@@ -202,22 +286,9 @@ class IdeaFeedbackCreateSerializer(serializers.ModelSerializer):
     
     def validate(self, attrs):
         """Validate feedback data based on type"""
-        feedback_type = attrs.get('feedback_type')
-        
-        if feedback_type == 'rating':
-            if not attrs.get('rating'):
-                raise ValidationError("Rating is required for rating feedback")
-            if not 1 <= attrs.get('rating', 0) <= 5:
-                raise ValidationError("Rating must be between 1 and 5")
-        
-        elif feedback_type == 'comment':
-            if not attrs.get('comment'):
-                raise ValidationError("Comment is required for comment feedback")
-        
-        elif feedback_type == 'report':
-            if not attrs.get('report_reason'):
-                raise ValidationError("Report reason is required for report feedback")
-        
+        validator = _FEEDBACK_VALIDATORS.get(attrs.get('feedback_type'))
+        if validator is not None:
+            validator(attrs)
         return attrs
     
     def create(self, validated_data):
@@ -234,12 +305,7 @@ class IdeaFeedbackCreateSerializer(serializers.ModelSerializer):
     
     def get_client_ip(self, request):
         """Get client IP address"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
+        return get_client_ip(request)
 
 
 class IdeaFeedbackSerializer(serializers.ModelSerializer):
@@ -282,6 +348,45 @@ class IdeaBookmarkSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class BookmarkedIdeaSummarySerializer(serializers.Serializer):
+    """Minimal idea representation nested in bookmark listings"""
+    id = serializers.UUIDField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
+class IdeaBookmarkListSerializer(serializers.Serializer):
+    """
+    Lightweight serializer for bookmark listings
+    
+    Expects rows from IdeaBookmark.objects.values(*BOOKMARK_LIST_VALUES)
+    rather than model instances, so no GeneratedIdea is ever hydrated.
+    """
+    BOOKMARK_LIST_VALUES = (
+        'id', 'notes', 'created_at', 'updated_at',
+        'idea__id', 'idea__title', 'idea__created_at'
+    )
+    
+    id = serializers.UUIDField(read_only=True)
+    idea = BookmarkedIdeaSummarySerializer(read_only=True)
+    notes = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    
+    def to_representation(self, row):
+        return {
+            'id': str(row['id']),
+            'idea': {
+                'id': str(row['idea__id']),
+                'title': row['idea__title'],
+                'created_at': _DATETIME_FIELD.to_representation(row['idea__created_at']),
+            },
+            'notes': row['notes'],
+            'created_at': _DATETIME_FIELD.to_representation(row['created_at']),
+            'updated_at': _DATETIME_FIELD.to_representation(row['updated_at']),
+        }
+
+
 class IdeaUsageStatsSerializer(serializers.ModelSerializer):
     """Serializer for usage statistics"""
     success_rate = serializers.SerializerMethodField()
@@ -296,9 +401,11 @@ class IdeaUsageStatsSerializer(serializers.ModelSerializer):
     
     def get_success_rate(self, obj):
         """Calculate success rate percentage"""
-        if obj.total_requests == 0:
+        total = obj.total_requests
+        if not total:
             return 0.0
-        return round((obj.successful_generations / obj.total_requests) * 100, 2)
+        # Basis points in integer arithmetic, rounded half up to 2 decimals
+        return (obj.successful_generations * 10000 + total // 2) // total / 100.0
 
 
 class AIModelConfigurationSerializer(serializers.ModelSerializer):
@@ -373,6 +480,9 @@ class UserIdeaStatsSerializer(serializers.Serializer):
     last_request_date = serializers.DateTimeField()
 
 
+_BULK_FEEDBACK_REQUIRED_KEYS = frozenset({'idea_id', 'feedback_type'})
+
+
 class BulkIdeaFeedbackSerializer(serializers.Serializer):
     """Serializer for bulk feedback operations"""
     feedback_data = serializers.ListField(
@@ -382,12 +492,10 @@ class BulkIdeaFeedbackSerializer(serializers.Serializer):
     
     def validate_feedback_data(self, value):
         """Validate each feedback item"""
-        for item in value:
-            if 'idea_id' not in item or 'feedback_type' not in item:
-                raise ValidationError("Each item must have 'idea_id' and 'feedback_type'")
-            
-            feedback_type = item['feedback_type']
-            if feedback_type == 'rating' and 'rating' not in item:
-                raise ValidationError("Rating feedback must include 'rating' field")
+        if not all(_BULK_FEEDBACK_REQUIRED_KEYS <= item.keys() for item in value):
+            raise ValidationError("Each item must have 'idea_id' and 'feedback_type'")
+        
+        if any(item['feedback_type'] == 'rating' and 'rating' not in item for item in value):
+            raise ValidationError("Rating feedback must include 'rating' field")
         
         return value
\ No newline at end of file
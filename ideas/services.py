@@ -2,18 +2,35 @@
 import logging
 import json
 import re
-from typing import Dict, List, Optional, Tuple, Any
+import time
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from decimal import Decimal
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from django.conf import settings
-from django.db import transaction, models
-from django.db.models import Avg, Count, Q, F, Sum
+from django.db import IntegrityError, transaction, models
+from django.db.models import Avg, Case, Count, DateField, Q, F, IntegerField, OuterRef, Subquery, Sum, Value, When, Window
+from django.db.models.functions import Cast, Coalesce, Greatest, NullIf, TruncDate, TruncWeek
 from django.utils import timezone
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
+from django_redis import get_redis_connection
+
+# Try to import orjson for faster parsing of AI responses, fallback to json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from core.exceptions import ServiceUnavailableError, ValidationError as CustomValidationError
 from .models import (
@@ -26,6 +43,134 @@ from .prompt_templates import PromptTemplateEngine
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Redis stream of idea interactions, applied in batches by tasks.drain_interactions
+INTERACTION_STREAM_KEY = 'idea_interactions'
+INTERACTION_STREAM_MAXLEN = 100000
+
+# Set while a bulk write bumps the global stats revision once for all its rows
+_GLOBAL_STATS_BUMP_DEFERRED = ContextVar('global_stats_bump_deferred', default=False)
+
+# Section labels recognised in text responses, mapped to the key they are
+# collected under. Keys are listed per field in priority order further down.
+LINE_SECTION_LABELS = {
+    'title': 'title',
+    'idea': 'idea',
+    'cost': 'cost',
+    'budget': 'cost',
+    'price': 'cost',
+    'duration': 'duration',
+    'time': 'duration',
+}
+
+BLOCK_SECTION_LABELS = {
+    'description': 'description',
+    'summary': 'summary',
+    'detailed plan': 'plan',
+    'plan': 'plan',
+    'steps': 'steps',
+    'locations': 'locations',
+    'location': 'locations',
+    'places': 'places',
+    'place': 'places',
+    'preparation': 'preparation',
+    'tips': 'preparation',
+    'prep': 'preparation',
+    'getting ready': 'before',
+    'before': 'before',
+    'alternatives': 'alternatives',
+    'alternative': 'alternatives',
+    'options': 'options',
+    'option': 'options',
+}
+
+
+def _label_alternation(labels) -> str:
+    """Build a regex alternation that prefers the longest label"""
+    return '|'.join(re.escape(label) for label in sorted(labels, key=len, reverse=True))
+
+
+# Single pass over a text response. The whole pattern sits in a lookahead so
+# finditer() reports a match at every label position, including labels that
+# appear inside another section, exactly like independent searches would.
+# Line sections run to the end of the line; block sections run until a line
+# that starts with another "Label:" or a blank line.
+SECTION_PATTERN = re.compile(
+    r'(?=(?P<line_label>' + _label_alternation(LINE_SECTION_LABELS) + r'):\s*(?P<line_value>[^\n]+)'
+    r'|(?P<block_label>' + _label_alternation(BLOCK_SECTION_LABELS) + r'):\s*(?P<block_value>.+?)'
+    r'\n(?:[A-Z][a-z]*:|$))',
+    re.MULTILINE | re.IGNORECASE | re.DOTALL
+)
+
+# Fallbacks used only when the corresponding label is missing
+FIRST_LINE_PATTERN = re.compile(r'^(.+?)(?:\n|$)', re.MULTILINE)
+COST_AMOUNT_PATTERN = re.compile(r'\$\d+(?:\.\d{2})?(?:\s*-\s*\$\d+(?:\.\d{2})?)?')
+DURATION_AMOUNT_PATTERN = re.compile(r'(?:\d+(?:\.\d+)?)\s*(?:hours?|hrs?|minutes?|mins?)', re.IGNORECASE)
+
+LOCATION_SPLIT_PATTERN = re.compile(r'[,\n]|\d+\.')
+
+# Quality score points by content length: bisect_right over the thresholds
+# gives the index into the points, e.g. a 60 character description is past
+# the 1 and 51 thresholds and scores DESCRIPTION_POINTS[2]
+TITLE_LENGTH_THRESHOLDS = (1, 11)
+TITLE_POINTS = (0.0, 1.0, 2.0)
+DESCRIPTION_LENGTH_THRESHOLDS = (1, 51, 101)
+DESCRIPTION_POINTS = (0.0, 1.0, 2.0, 3.0)
+PLAN_LENGTH_THRESHOLDS = (1, 101)
+PLAN_POINTS = (0.0, 1.0, 2.0)
+
+# Same lookup for IdeaValidationService._calculate_content_quality
+CONTENT_TITLE_LENGTH_THRESHOLDS = (1, 10, 101)
+CONTENT_TITLE_POINTS = (0.0, 0.5, 1.0, 0.5)
+CONTENT_DESCRIPTION_LENGTH_THRESHOLDS = (50, 100)
+CONTENT_DESCRIPTION_POINTS = (0.0, 1.0, 2.0)
+
+# System prompt for asking several ideas in a single completion
+BATCH_SYSTEM_PROMPT = (
+    "You will receive a JSON array of {count} date idea requests. Answer every request "
+    "and reply with a JSON object of the form {{\"ideas\": [...]}} holding one idea per "
+    "request, in the same order. Each idea is an object with the keys request (the number "
+    "of the request it answers), title, description, detailed_plan, estimated_cost, "
+    "duration, location_suggestions, preparation_tips and alternatives."
+)
+
+# Words in past requests, used for preference keywords
+PREFERENCE_WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Words of three or more letters, used for matching requests to templates
+KEYWORD_PATTERN = re.compile(r'[a-z]{3,}')
+
+# Number of preferred categories kept in a user's taste profile
+TASTE_PROFILE_SIZE = 5
+
+# Basic content filter, scanned with a single compiled alternation
+INAPPROPRIATE_KEYWORDS = ('violence', 'illegal', 'drugs', 'alcohol abuse')
+INAPPROPRIATE_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, INAPPROPRIATE_KEYWORDS)))
+
+
+def _keywords(text: str) -> set:
+    """Lowercase keyword set of a piece of text"""
+    return set(KEYWORD_PATTERN.findall(text.lower()))
+
+
+@lru_cache(maxsize=32)
+def _load_ai_model_config(model_name: str, revision: int, ttl_bucket: int) -> Optional[AIModelConfiguration]:
+    """
+    Load an active AI model configuration, cached per process.
+    Saves bump the shared revision through the post_save signal, so every
+    process moves to a new key; ttl_bucket rolls over as a safety net.
+    """
+    configs = AIModelConfiguration.objects.only('id', 'name', 'model_id', 'priority')
+    try:
+        return configs.get(
+            name=model_name,
+            is_active=True
+        )
+    except AIModelConfiguration.DoesNotExist:
+        # Fallback to default model
+        return configs.filter(
+            is_active=True
+        ).order_by('priority').first()
+
 
 @dataclass
 class IdeaGenerationRequest:
@@ -64,6 +209,22 @@ class GeneratedIdeaResult:
     generation_tokens: int
 
 
+@dataclass
+class CachedIdea:
+    """Data class for idea data kept in the cache"""
+    id: Any
+    request_id: Any
+    title: str
+    description: str
+    detailed_plan: str
+    user_rating: Optional[Decimal]
+    like_count: int
+    view_count: int
+    template_used_id: Any
+    template_name: Optional[str]
+    category_name: Optional[str]
+
+
 class IdeaGenerationService:
     """
     Service for handling AI-powered idea generation
@@ -73,6 +234,13 @@ class IdeaGenerationService:
         self.ai_client = AIClient()
         self.prompt_engine = PromptTemplateEngine()
         self.cache_timeout = getattr(settings, 'IDEA_CACHE_TIMEOUT', 3600)
+        self.max_concurrent_completions = getattr(settings, 'AI_MAX_CONCURRENT_COMPLETIONS', 5)
+        self.min_quality_score = getattr(settings, 'MIN_IDEA_QUALITY_SCORE', 2.0)
+        self.max_prompts_per_request = getattr(settings, 'AI_MAX_PROMPTS_PER_REQUEST', 3)
+        self.batch_prompts = getattr(settings, 'AI_BATCH_PROMPTS', True)
+        self.batch_max_tokens = getattr(settings, 'AI_BATCH_MAX_TOKENS', 4000)
+        self.batch_min_tokens_per_idea = getattr(settings, 'AI_BATCH_MIN_TOKENS_PER_IDEA', 800)
+        self.batch_max_prompt_length = getattr(settings, 'AI_BATCH_MAX_PROMPT_LENGTH', 10000)
     
     def generate_ideas(self, request_data: IdeaGenerationRequest) -> List[GeneratedIdeaResult]:
         """
@@ -98,38 +266,25 @@ class IdeaGenerationService:
             # Generate prompts using template engine
             prompts = self._generate_prompts(request_data)
             
-            # Generate ideas using AI
-            generated_ideas = []
-            for prompt_data in prompts:
-                try:
-                    ai_response = self.ai_client.generate_completion(
-                        prompt=prompt_data['prompt'],
-                        model=ai_config.model_id,
-                        temperature=request_data.temperature,
-                        max_tokens=request_data.max_tokens,
-                        user_id=request_data.user_id
-                    )
-                    
-                    # Parse and validate AI response
-                    parsed_idea = self._parse_ai_response(
-                        ai_response, 
-                        prompt_data['template_used'],
-                        prompt_data['prompt']
-                    )
-                    
-                    if parsed_idea:
-                        generated_ideas.append(parsed_idea)
-                        
-                except Exception as e:
-                    logger.error(f"Failed to generate idea: {str(e)}")
+            # Generate ideas using AI, preferring a single batched completion
+            # and otherwise one completion per prompt, and apply quality
+            # filtering as the results come in
+            results = self._generate_ideas_batched(prompts, ai_config, request_data)
+            if results is None:
+                results = self._generate_ideas_concurrently(prompts, ai_config, request_data)
+            
+            generated_count = 0
+            quality_ideas = []
+            for idea in results:
+                if idea is None:
                     continue
+                generated_count += 1
+                if idea.content_quality_score >= self.min_quality_score:
+                    quality_ideas.append(idea)
             
-            if not generated_ideas:
+            if not generated_count:
                 raise ServiceUnavailableError("Failed to generate any ideas")
             
-            # Apply quality filtering
-            quality_ideas = self._filter_quality_ideas(generated_ideas)
-            
             # Log generation metrics
             self._log_generation_metrics(request_data, len(quality_ideas))
             
@@ -139,6 +294,146 @@ class IdeaGenerationService:
             logger.error(f"Idea generation failed: {str(e)}")
             raise ServiceUnavailableError(f"Idea generation service unavailable: {str(e)}")
     
+    def _generate_ideas_concurrently(
+        self,
+        prompts: List[Dict],
+        ai_config: AIModelConfiguration,
+        request_data: IdeaGenerationRequest
+    ) -> Iterator[Optional[GeneratedIdeaResult]]:
+        """
+        Issue one completion per prompt concurrently, since each one is a
+        slow network round trip to the provider
+        """
+        if not prompts:
+            return
+        
+        # Identical prompts are common across users, so look up every
+        # prompt's cached response in one round trip before calling the AI
+        cached_responses = self.ai_client.get_cached_responses(
+            [prompt_data['prompt'] for prompt_data in prompts],
+            ai_config.model_id,
+            request_data.temperature
+        )
+        missing_prompts = [
+            prompt_data for prompt_data in prompts
+            if prompt_data['prompt'] not in cached_responses
+        ]
+        
+        fresh_responses = {}
+        if missing_prompts:
+            max_workers = min(len(missing_prompts), self.max_concurrent_completions)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda prompt_data: self._request_completion(prompt_data, ai_config, request_data),
+                    missing_prompts
+                )
+                for prompt_data, ai_response in zip(missing_prompts, results):
+                    if ai_response:
+                        fresh_responses[prompt_data['prompt']] = ai_response
+            
+            self.ai_client.cache_responses(fresh_responses, ai_config.model_id, request_data.temperature)
+        
+        for prompt_data in prompts:
+            ai_response = cached_responses.get(prompt_data['prompt']) or fresh_responses.get(prompt_data['prompt'])
+            if ai_response is None:
+                yield None
+                continue
+            
+            # Parse and validate AI response
+            yield self._parse_ai_response(
+                ai_response,
+                prompt_data['template_used'],
+                prompt_data['prompt']
+            )
+    
+    def _generate_ideas_batched(
+        self,
+        prompts: List[Dict],
+        ai_config: AIModelConfiguration,
+        request_data: IdeaGenerationRequest
+    ) -> Optional[List[GeneratedIdeaResult]]:
+        """
+        Ask for all ideas in a single JSON completion. Returns None when the
+        prompts don't fit in one request or the batched call fails, so the
+        caller can fall back to one completion per prompt.
+        """
+        if not self.batch_prompts or len(prompts) < 2:
+            return None
+        
+        # Share the batch budget between the ideas, as long as each one still
+        # gets enough tokens for a complete answer
+        tokens_per_idea = min(request_data.max_tokens, self.batch_max_tokens // len(prompts))
+        if tokens_per_idea < self.batch_min_tokens_per_idea:
+            return None
+        
+        batch_prompt = json.dumps(
+            [{'request': index + 1, 'prompt': prompt_data['prompt']} for index, prompt_data in enumerate(prompts)]
+        )
+        if len(batch_prompt) > self.batch_max_prompt_length:
+            return None
+        
+        try:
+            ai_response = self.ai_client.generate_completion(
+                prompt=batch_prompt,
+                model=ai_config.model_id,
+                temperature=request_data.temperature,
+                max_tokens=tokens_per_idea * len(prompts),
+                user_id=request_data.user_id,
+                system_prompt=BATCH_SYSTEM_PROMPT.format(count=len(prompts)),
+                json_mode=True
+            )
+            
+            content = ai_response.get('content', '')
+            ideas_data = (orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)).get('ideas', [])
+            if not isinstance(ideas_data, list) or not ideas_data:
+                return None
+            
+            # Split the token usage evenly between the ideas of the batch
+            usage = ai_response.get('usage', {})
+            idea_response = dict(ai_response, usage={
+                'total_tokens': usage.get('total_tokens', 0) // len(ideas_data)
+            })
+            
+            # Pair each idea with the prompt it answers by its request number,
+            # falling back to its position when the model leaves it out
+            results = []
+            for position, idea_data in enumerate(ideas_data, start=1):
+                if not isinstance(idea_data, dict):
+                    continue
+                request_number = idea_data.get('request', position)
+                if not isinstance(request_number, int) or not 1 <= request_number <= len(prompts):
+                    continue
+                results.append(self._create_idea_from_json(
+                    idea_data, idea_response, prompts[request_number - 1]['prompt']
+                ))
+            
+            return results or None
+            
+        except Exception as e:
+            logger.error(f"Batched idea generation failed, falling back to single prompts: {str(e)}")
+            return None
+    
+    def _request_completion(
+        self,
+        prompt_data: Dict,
+        ai_config: AIModelConfiguration,
+        request_data: IdeaGenerationRequest
+    ) -> Optional[Dict]:
+        """Request a single completion, returning None on failure"""
+        try:
+            return self.ai_client.generate_completion(
+                prompt=prompt_data['prompt'],
+                model=ai_config.model_id,
+                temperature=request_data.temperature,
+                max_tokens=request_data.max_tokens,
+                user_id=request_data.user_id,
+                use_cache=False
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to generate idea: {str(e)}")
+            return None
+    
     def _validate_generation_request(self, request_data: IdeaGenerationRequest) -> None:
         """Validate generation request data"""
         if not request_data.user_id:
@@ -165,23 +460,22 @@ class IdeaGenerationService:
             raise CustomValidationError("Max tokens must be between 100 and 4000")
     
     def _get_ai_model_config(self, model_name: str) -> AIModelConfiguration:
-        """Get AI model configuration"""
-        try:
-            config = AIModelConfiguration.objects.get(
-                name=model_name,
-                is_active=True
-            )
-            return config
-        except AIModelConfiguration.DoesNotExist:
-            # Fallback to default model
-            return AIModelConfiguration.objects.filter(
-                is_active=True
-            ).order_by('priority').first()
+        """Get AI model configuration from the per-process cache"""
+        ttl = getattr(settings, 'AI_MODEL_CONFIG_CACHE_TTL', 60)
+        return _load_ai_model_config(
+            model_name,
+            IdeaCacheService.get_ai_model_config_revision(),
+            int(time.time() // ttl)
+        )
     
     def _generate_prompts(self, request_data: IdeaGenerationRequest) -> List[Dict]:
         """Generate prompts using template engine"""
-        # Get suitable templates based on user preferences
-        templates = self._select_templates(request_data)
+        # Get suitable templates based on user preferences, keeping only the
+        # ones most relevant to the request since each costs an AI call
+        templates = self._rank_templates(
+            self._select_templates(request_data),
+            request_data
+        )[:self.max_prompts_per_request]
         
         prompts = []
         for template in templates:
@@ -214,6 +508,26 @@ class IdeaGenerationService:
         
         return prompts
     
+    def _rank_templates(self, templates: List[IdeaTemplate], request_data: IdeaGenerationRequest) -> List[IdeaTemplate]:
+        """Order templates by keyword overlap with the request, keeping ties in place"""
+        request_keywords = _keywords(' '.join(filter(None, [
+            request_data.occasion,
+            request_data.partner_interests,
+            request_data.user_interests,
+            request_data.personality_type,
+            request_data.special_requirements,
+            request_data.custom_prompt,
+        ])))
+        if not request_keywords:
+            return list(templates)
+        
+        return sorted(
+            templates,
+            key=lambda template: -len(request_keywords & _keywords(
+                f"{template.name} {template.template_type.replace('_', ' ')} {template.description}"
+            ))
+        )
+    
     def _select_templates(self, request_data: IdeaGenerationRequest) -> List[IdeaTemplate]:
         """Select appropriate templates based on user preferences"""
         # Cache key for template selection
@@ -221,23 +535,29 @@ class IdeaGenerationService:
         templates = cache.get(cache_key)
         
         if templates is None:
-            # Get user to check subscription tier
+            # Get user (and subscription) to check subscription tier
             try:
-                user = User.objects.get(id=request_data.user_id)
+                user = User.objects.select_related('subscription').get(id=request_data.user_id)
                 templates = IdeaTemplate.objects.for_user_tier(user)
                 
-                # Filter by preferences
-                if request_data.budget != 'any':
-                    # Logic to match templates with budget preferences
-                    budget_templates = self._filter_templates_by_budget(templates, request_data.budget)
-                    templates = budget_templates if budget_templates.exists() else templates
+                # Rank templates by how well they match the preferences and
+                # keep only the best matching tier, falling back to looser
+                # matches when nothing fits both budget and location
+                budget_types = self._budget_template_types(request_data.budget)
+                location_types = self._location_template_types(request_data.location_type)
+                templates = templates.annotate(
+                    budget_match=self._template_type_match(budget_types),
+                    location_match=self._template_type_match(location_types)
+                ).order_by('-budget_match', '-location_match', '-usage_count', '-average_rating')
                 
-                if request_data.location_type != 'any':
-                    # Logic to match templates with location preferences
-                    location_templates = self._filter_templates_by_location(templates, request_data.location_type)
-                    templates = location_templates if location_templates.exists() else templates
-                
-                templates = list(templates.order_by('-usage_count', '-average_rating')[:5])
+                ranked = list(templates[:5])
+                if ranked:
+                    best_match = (ranked[0].budget_match, ranked[0].location_match)
+                    ranked = [
+                        template for template in ranked
+                        if (template.budget_match, template.location_match) == best_match
+                    ]
+                templates = ranked
                 cache.set(cache_key, templates, self.cache_timeout)
                 
             except User.DoesNotExist:
@@ -245,58 +565,52 @@ class IdeaGenerationService:
         
         return templates
     
-    def _filter_templates_by_budget(self, templates, budget: str):
-        """Filter templates by budget preference"""
+    def _template_type_match(self, template_types: List[str]) -> Case:
+        """Annotation that is 1 when a template has one of the given types"""
+        if not template_types:
+            return Value(0, output_field=IntegerField())
+        return Case(
+            When(template_type__in=template_types, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField()
+        )
+    
+    def _budget_template_types(self, budget: str) -> List[str]:
+        """Template types matching a budget preference"""
         budget_mapping = {
             'low': ['budget_friendly', 'casual'],
             'moderate': ['casual', 'romantic', 'creative'],
             'high': ['luxurious', 'romantic', 'adventurous'],
             'unlimited': ['luxurious', 'adventurous', 'creative']
         }
-        
-        template_types = budget_mapping.get(budget, [])
-        if template_types:
-            return templates.filter(template_type__in=template_types)
-        return templates
+        return budget_mapping.get(budget, [])
     
-    def _filter_templates_by_location(self, templates, location_type: str):
-        """Filter templates by location type"""
+    def _location_template_types(self, location_type: str) -> List[str]:
+        """Template types matching a location preference"""
         location_mapping = {
             'indoor': ['indoor', 'relaxed', 'cultural'],
             'outdoor': ['outdoor', 'adventurous', 'active'],
             'mixed': ['casual', 'romantic', 'creative']
         }
-        
-        template_types = location_mapping.get(location_type, [])
-        if template_types:
-            return templates.filter(template_type__in=template_types)
-        return templates
+        return location_mapping.get(location_type, [])
     
     def _parse_ai_response(self, ai_response: Dict, template_used: IdeaTemplate, prompt_used: str) -> Optional[GeneratedIdeaResult]:
         """Parse AI response into structured idea data"""
         try:
             content = ai_response.get('content', '')
             
-            # Try to parse as JSON first
-            if self._is_json_response(content):
-                parsed_data = json.loads(content)
-                return self._create_idea_from_json(parsed_data, ai_response, prompt_used)
+            # Try to parse as JSON first, falling back to structured text
+            try:
+                parsed_data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content.strip())
+            except json.JSONDecodeError:
+                return self._create_idea_from_text(content, ai_response, prompt_used)
             
-            # Parse as structured text
-            return self._create_idea_from_text(content, ai_response, prompt_used)
+            return self._create_idea_from_json(parsed_data, ai_response, prompt_used)
             
         except Exception as e:
             logger.error(f"Failed to parse AI response: {str(e)}")
             return None
     
-    def _is_json_response(self, content: str) -> bool:
-        """Check if response is JSON format"""
-        try:
-            json.loads(content.strip())
-            return True
-        except json.JSONDecodeError:
-            return False
-    
     def _create_idea_from_json(self, data: Dict, ai_response: Dict, prompt_used: str) -> GeneratedIdeaResult:
         """Create idea result from JSON data"""
         return GeneratedIdeaResult(
@@ -308,34 +622,31 @@ class IdeaGenerationService:
             location_suggestions=data.get('location_suggestions', []),
             preparation_tips=data.get('preparation_tips', ''),
             alternatives=data.get('alternatives', ''),
-            content_quality_score=self._calculate_quality_score(data),
-            ai_response_raw=json.dumps(ai_response),
+            content_quality_score=self._calculate_quality_score(
+                data.get('title', ''),
+                data.get('description', ''),
+                data.get('detailed_plan', ''),
+                data.get('estimated_cost'),
+                data.get('duration'),
+                data.get('location_suggestions', [])
+            ),
+            ai_response_raw=ai_response.get('_raw', ''),
             prompt_used=prompt_used,
             generation_tokens=ai_response.get('usage', {}).get('total_tokens', 0)
         )
     
     def _create_idea_from_text(self, content: str, ai_response: Dict, prompt_used: str) -> GeneratedIdeaResult:
         """Create idea result from text content"""
-        # Extract structured information using regex patterns
-        title = self._extract_title(content)
-        description = self._extract_description(content)
-        detailed_plan = self._extract_detailed_plan(content)
-        estimated_cost = self._extract_cost(content)
-        duration = self._extract_duration(content)
-        location_suggestions = self._extract_locations(content)
-        preparation_tips = self._extract_preparation_tips(content)
-        alternatives = self._extract_alternatives(content)
-        
-        parsed_data = {
-            'title': title,
-            'description': description,
-            'detailed_plan': detailed_plan,
-            'estimated_cost': estimated_cost,
-            'duration': duration,
-            'location_suggestions': location_suggestions,
-            'preparation_tips': preparation_tips,
-            'alternatives': alternatives
-        }
+        # Extract structured information with a single scan over the content
+        sections = self._scan_sections(content)
+        title = self._extract_title(content, sections)
+        description = self._extract_description(content, sections)
+        detailed_plan = self._extract_detailed_plan(sections)
+        estimated_cost = self._extract_cost(content, sections)
+        duration = self._extract_duration(content, sections)
+        location_suggestions = self._extract_locations(sections)
+        preparation_tips = self._extract_preparation_tips(sections)
+        alternatives = self._extract_alternatives(sections)
         
         return GeneratedIdeaResult(
             title=title,
@@ -346,40 +657,56 @@ class IdeaGenerationService:
             location_suggestions=location_suggestions,
             preparation_tips=preparation_tips,
             alternatives=alternatives,
-            content_quality_score=self._calculate_quality_score(parsed_data),
-            ai_response_raw=json.dumps(ai_response),
+            content_quality_score=self._calculate_quality_score(
+                title, description, detailed_plan, estimated_cost, duration, location_suggestions
+            ),
+            ai_response_raw=ai_response.get('_raw', ''),
             prompt_used=prompt_used,
             generation_tokens=ai_response.get('usage', {}).get('total_tokens', 0)
         )
     
-    def _extract_title(self, content: str) -> str:
+    def _scan_sections(self, content: str) -> Dict[str, str]:
+        """Collect the first value of every labelled section in one pass"""
+        sections = {}
+        for match in SECTION_PATTERN.finditer(content):
+            line_label = match.group('line_label')
+            if line_label:
+                key = LINE_SECTION_LABELS[line_label.lower()]
+                value = match.group('line_value')
+            else:
+                key = BLOCK_SECTION_LABELS[match.group('block_label').lower()]
+                value = match.group('block_value')
+            
+            if key not in sections:
+                sections[key] = value.strip()
+        
+        return sections
+    
+    def _first_section(self, sections: Dict[str, str], *keys: str) -> Optional[str]:
+        """Get the first available section among keys, in priority order"""
+        for key in keys:
+            if key in sections:
+                return sections[key]
+        return None
+    
+    def _extract_title(self, content: str, sections: Dict[str, str]) -> str:
         """Extract title from text content"""
-        patterns = [
-            r'(?:Title|TITLE):\s*(.+)',
-            r'(?:Idea|IDEA):\s*(.+)',
-            r'^(.+?)(?:\n|$)',  # First line
-        ]
+        candidates = [sections.get('title'), sections.get('idea')]
+        if not any(candidate and len(candidate) > 10 for candidate in candidates):
+            first_line = FIRST_LINE_PATTERN.search(content)
+            candidates.append(first_line.group(1).strip() if first_line else None)
         
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
-            if match:
-                title = match.group(1).strip()
-                if len(title) > 10:  # Reasonable title length
-                    return title[:300]  # Limit title length
+        for title in candidates:
+            if title and len(title) > 10:  # Reasonable title length
+                return title[:300]  # Limit title length
         
         return "Creative Date Idea"
     
-    def _extract_description(self, content: str) -> str:
+    def _extract_description(self, content: str, sections: Dict[str, str]) -> str:
         """Extract description from text content"""
-        patterns = [
-            r'(?:Description|DESCRIPTION):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-            r'(?:Summary|SUMMARY):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        description = self._first_section(sections, 'description', 'summary')
+        if description is not None:
+            return description
         
         # Fallback: use first paragraph
         paragraphs = content.split('\n\n')
@@ -388,167 +715,121 @@ class IdeaGenerationService:
         
         return content[:500] + "..." if len(content) > 500 else content
     
-    def _extract_detailed_plan(self, content: str) -> str:
-        """Extract detailed plan from text content"""
-        patterns = [
-            r'(?:Plan|PLAN|Detailed Plan|DETAILED PLAN):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-            r'(?:Steps|STEPS):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
-        
-        return ""
+    def _extract_detailed_plan(self, sections: Dict[str, str]) -> str:
+        """Extract detailed plan from scanned sections"""
+        return self._first_section(sections, 'plan', 'steps') or ""
     
-    def _extract_cost(self, content: str) -> str:
+    def _extract_cost(self, content: str, sections: Dict[str, str]) -> str:
         """Extract cost information from text content"""
-        patterns = [
-            r'(?:Cost|COST|Budget|BUDGET|Price|PRICE):\s*(.+?)(?:\n|$)',
-            r'\$\d+(?:\.\d{2})?(?:\s*-\s*\$\d+(?:\.\d{2})?)?',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
-            if match:
-                return match.group(1).strip() if hasattr(match, 'group') else match.group(0).strip()
+        if 'cost' in sections:
+            return sections['cost']
         
-        return ""
+        match = COST_AMOUNT_PATTERN.search(content)
+        return match.group(0).strip() if match else ""
     
-    def _extract_duration(self, content: str) -> str:
+    def _extract_duration(self, content: str, sections: Dict[str, str]) -> str:
         """Extract duration from text content"""
-        patterns = [
-            r'(?:Duration|DURATION|Time|TIME):\s*(.+?)(?:\n|$)',
-            r'(?:\d+(?:\.\d+)?)\s*(?:hours?|hrs?|minutes?|mins?)',
-        ]
+        if 'duration' in sections:
+            return sections['duration']
         
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
-            if match:
-                return match.group(1).strip() if hasattr(match, 'group') else match.group(0).strip()
-        
-        return ""
+        match = DURATION_AMOUNT_PATTERN.search(content)
+        return match.group(0).strip() if match else ""
     
-    def _extract_locations(self, content: str) -> List[Dict]:
-        """Extract location suggestions from text content"""
-        patterns = [
-            r'(?:Locations?|LOCATIONS?):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-            r'(?:Places?|PLACES?):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-        ]
+    def _extract_locations(self, sections: Dict[str, str]) -> List[Dict]:
+        """Extract location suggestions from scanned sections"""
+        location_text = self._first_section(sections, 'locations', 'places')
+        if location_text is None:
+            return []
         
-        locations = []
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            if match:
-                location_text = match.group(1).strip()
-                # Split by commas, newlines, or numbered lists
-                location_list = re.split(r'[,\n]|\d+\.', location_text)
-                for loc in location_list:
-                    loc = loc.strip()
-                    if loc and len(loc) > 3:
-                        locations.append({
-                            'name': loc,
-                            'type': 'suggested',
-                            'description': ''
-                        })
-                break
-        
-        return locations[:10]  # Limit to 10 locations
-    
-    def _extract_preparation_tips(self, content: str) -> str:
-        """Extract preparation tips from text content"""
-        patterns = [
-            r'(?:Preparation|PREPARATION|Tips|TIPS|Prep|PREP):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-            r'(?:Before|BEFORE|Getting Ready|GETTING READY):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
+        # Split by commas, newlines, or numbered lists, stopping at 10 locations
+        names = (
+            name for name in map(str.strip, LOCATION_SPLIT_PATTERN.split(location_text))
+            if len(name) > 3
+        )
+        return [
+            {'name': name, 'type': 'suggested', 'description': ''}
+            for name in islice(names, 10)
         ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
-        
-        return ""
     
-    def _extract_alternatives(self, content: str) -> str:
-        """Extract alternatives from text content"""
-        patterns = [
-            r'(?:Alternatives?|ALTERNATIVES?):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-            r'(?:Options?|OPTIONS?):\s*(.+?)(?:\n(?:[A-Z][a-z]*:|$))',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
-        
-        return ""
+    def _extract_preparation_tips(self, sections: Dict[str, str]) -> str:
+        """Extract preparation tips from scanned sections"""
+        return self._first_section(sections, 'preparation', 'before') or ""
+    
+    def _extract_alternatives(self, sections: Dict[str, str]) -> str:
+        """Extract alternatives from scanned sections"""
+        return self._first_section(sections, 'alternatives', 'options') or ""
     
-    def _calculate_quality_score(self, data: Dict) -> float:
+    def _calculate_quality_score(
+        self,
+        title: str,
+        description: str,
+        detailed_plan: str,
+        estimated_cost: str,
+        duration: str,
+        locations: List
+    ) -> float:
         """Calculate content quality score"""
-        score = 0.0
         max_score = 10.0
         
-        # Title quality (0-2 points)
-        title = data.get('title', '')
-        if title and len(title) > 10:
-            score += 2.0
-        elif title:
-            score += 1.0
-        
-        # Description quality (0-3 points)
-        description = data.get('description', '')
-        if len(description) > 100:
-            score += 3.0
-        elif len(description) > 50:
-            score += 2.0
-        elif description:
-            score += 1.0
-        
-        # Detailed plan quality (0-2 points)
-        detailed_plan = data.get('detailed_plan', '')
-        if len(detailed_plan) > 100:
-            score += 2.0
-        elif detailed_plan:
-            score += 1.0
-        
-        # Cost information (0-1 point)
-        if data.get('estimated_cost'):
-            score += 1.0
-        
-        # Duration information (0-1 point)
-        if data.get('duration'):
-            score += 1.0
-        
-        # Location suggestions (0-1 point)
-        locations = data.get('location_suggestions', [])
-        if locations and len(locations) > 0:
-            score += 1.0
+        # Length based points for title (0-2), description (0-3) and
+        # detailed plan (0-2), looked up from the length thresholds
+        score = (
+            TITLE_POINTS[bisect_right(TITLE_LENGTH_THRESHOLDS, len(title or ''))]
+            + DESCRIPTION_POINTS[bisect_right(DESCRIPTION_LENGTH_THRESHOLDS, len(description))]
+            + PLAN_POINTS[bisect_right(PLAN_LENGTH_THRESHOLDS, len(detailed_plan))]
+        )
+        
+        # Cost, duration and location information (0-1 point each)
+        score += bool(estimated_cost) + bool(duration) + bool(locations)
         
         return round((score / max_score) * 5.0, 2)  # Convert to 5-point scale
     
-    def _filter_quality_ideas(self, ideas: List[GeneratedIdeaResult]) -> List[GeneratedIdeaResult]:
-        """Filter ideas based on quality score"""
-        min_quality_score = getattr(settings, 'MIN_IDEA_QUALITY_SCORE', 2.0)
-        return [idea for idea in ideas if idea.content_quality_score >= min_quality_score]
-    
     def _log_generation_metrics(self, request_data: IdeaGenerationRequest, ideas_count: int) -> None:
         """Log generation metrics for analytics"""
         try:
             logger.info(f"Generated {ideas_count} ideas for user {request_data.user_id}")
             
-            # Update usage stats (this could be done async)
+            # Update usage stats once the surrounding transaction commits.
+            # The message is non-persistent since the stats are best-effort.
+            # Imported here because tasks imports this module.
             from .tasks import update_usage_stats
-            update_usage_stats.delay(
-                user_id=request_data.user_id,
-                ideas_generated=ideas_count,
-                tokens_used=request_data.max_tokens,
-                model_used=request_data.ai_model
-            )
+            transaction.on_commit(partial(
+                update_usage_stats.apply_async,
+                kwargs={
+                    'user_id': request_data.user_id,
+                    'ideas_generated': ideas_count,
+                    'tokens_used': request_data.max_tokens,
+                    'model_used': request_data.ai_model
+                },
+                delivery_mode=1
+            ))
             
         except Exception as e:
             logger.error(f"Failed to log generation metrics: {str(e)}")
     
+    def create_ideas(self, idea_request: IdeaRequest, ideas: List[GeneratedIdeaResult]) -> List[GeneratedIdea]:
+        """Insert generated ideas for a request in a single query, leaving its status alone"""
+        # Build all instances first and insert them in a single query
+        return GeneratedIdea.objects.bulk_create([
+            GeneratedIdea(
+                request=idea_request,
+                title=idea_result.title,
+                description=idea_result.description,
+                detailed_plan=idea_result.detailed_plan,
+                estimated_cost=idea_result.estimated_cost,
+                duration=idea_result.duration,
+                location_suggestions=idea_result.location_suggestions,
+                preparation_tips=idea_result.preparation_tips,
+                alternatives=idea_result.alternatives,
+                ai_model_used=idea_request.ai_model,
+                prompt_used=idea_result.prompt_used,
+                ai_response_raw=idea_result.ai_response_raw,
+                generation_tokens=idea_result.generation_tokens,
+                content_quality_score=idea_result.content_quality_score
+            )
+            for idea_result in ideas
+        ], batch_size=100)
+    
     @transaction.atomic
     def save_generated_ideas(self, request_id: int, ideas: List[GeneratedIdeaResult]) -> List[GeneratedIdea]:
         """
@@ -562,27 +843,12 @@ class IdeaGenerationService:
             List of saved GeneratedIdea objects
         """
         try:
-            idea_request = IdeaRequest.objects.get(id=request_id)
-            saved_ideas = []
+            # Only the columns needed to link the ideas and mark completion
+            idea_request = IdeaRequest.objects.only(
+                'id', 'status', 'ai_model', 'processing_completed_at'
+            ).get(id=request_id)
             
-            for idea_result in ideas:
-                generated_idea = GeneratedIdea.objects.create(
-                    request=idea_request,
-                    title=idea_result.title,
-                    description=idea_result.description,
-                    detailed_plan=idea_result.detailed_plan,
-                    estimated_cost=idea_result.estimated_cost,
-                    duration=idea_result.duration,
-                    location_suggestions=idea_result.location_suggestions,
-                    preparation_tips=idea_result.preparation_tips,
-                    alternatives=idea_result.alternatives,
-                    ai_model_used=idea_request.ai_model,
-                    prompt_used=idea_result.prompt_used,
-                    ai_response_raw=idea_result.ai_response_raw,
-                    generation_tokens=idea_result.generation_tokens,
-                    content_quality_score=idea_result.content_quality_score
-                )
-                saved_ideas.append(generated_idea)
+            saved_ideas = self.create_ideas(idea_request, ideas)
             
             # Mark request as completed
             idea_request.mark_as_completed()
@@ -610,53 +876,109 @@ class IdeaAnalyticsService:
         stats = cache.get(cache_key)
         
         if stats is None:
-            requests = IdeaRequest.objects.for_user(user)
-            ideas = GeneratedIdea.objects.for_user(user)
-            
-            stats = {
-                'total_requests': requests.count(),
-                'completed_requests': requests.completed().count(),
-                'pending_requests': requests.pending().count(),
-                'failed_requests': requests.failed().count(),
-                'total_ideas': ideas.count(),
-                'total_views': ideas.aggregate(total=Sum('view_count'))['total'] or 0,
-                'total_likes': ideas.aggregate(total=Sum('like_count'))['total'] or 0,
-                'total_shares': ideas.aggregate(total=Sum('share_count'))['total'] or 0,
-                'average_rating': ideas.aggregate(avg=Avg('user_rating'))['avg'] or 0,
-                'bookmarked_ideas': IdeaBookmark.objects.filter(user=user).count(),
-                'feedback_given': IdeaFeedback.objects.for_user(user).count(),
-            }
+            stats = IdeaAnalyticsService._compute_user_stats(user)
             
             # Cache for 15 minutes
             cache.set(cache_key, stats, 900)
         
         return stats
     
+    @staticmethod
+    def _compute_user_stats(user: User, recent_since: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Compute user statistics from the database. With recent_since the
+        request and idea counts since then are computed in the same queries
+        and returned under 'recent_activity'.
+        """
+        # One query per table, with the status counts as conditional aggregates
+        request_aggregates = {
+            'total': Count('id'),
+            'completed': Count('id', filter=Q(status='completed')),
+            'pending': Count('id', filter=Q(status='pending')),
+            'failed': Count('id', filter=Q(status='failed')),
+        }
+        idea_aggregates = {
+            'total': Count('id'),
+            'views': Sum('view_count'),
+            'likes': Sum('like_count'),
+            'shares': Sum('share_count'),
+            'rating': Avg('user_rating'),
+        }
+        if recent_since is not None:
+            request_aggregates['recent'] = Count('id', filter=Q(created_at__gte=recent_since))
+            idea_aggregates['recent'] = Count('id', filter=Q(created_at__gte=recent_since))
+        
+        request_stats = IdeaRequest.objects.for_user(user).aggregate(**request_aggregates)
+        idea_stats = GeneratedIdea.objects.for_user(user).aggregate(**idea_aggregates)
+        
+        stats = {
+            'total_requests': request_stats['total'],
+            'completed_requests': request_stats['completed'],
+            'pending_requests': request_stats['pending'],
+            'failed_requests': request_stats['failed'],
+            'total_ideas': idea_stats['total'],
+            'total_views': idea_stats['views'] or 0,
+            'total_likes': idea_stats['likes'] or 0,
+            'total_shares': idea_stats['shares'] or 0,
+            'average_rating': idea_stats['rating'] or 0,
+            'bookmarked_ideas': IdeaBookmark.objects.filter(user=user).count(),
+            'feedback_given': IdeaFeedback.objects.for_user(user).count(),
+        }
+        if recent_since is not None:
+            stats['recent_activity'] = {
+                'requests_this_week': request_stats['recent'],
+                'ideas_this_week': idea_stats['recent'],
+            }
+        return stats
+    
     @staticmethod
     def get_user_overview(user: User) -> Dict[str, Any]:
         """Get user overview dashboard data"""
-        stats = IdeaAnalyticsService.get_user_stats(user)
-        
-        # Recent activity
-        recent_requests = IdeaRequest.objects.for_user(user).recent(days=7)
-        recent_ideas = GeneratedIdea.objects.for_user(user).recent(days=7)
+        # Both cached parts are read in one round trip. They are cached
+        # together, so on a miss they are rebuilt together: the recent
+        # activity counts piggyback on the stats aggregates.
+        stats_key = f"user_stats_{user.id}"
+        overview_key = f"user_overview_{user.id}"
+        cached = cache.get_many([stats_key, overview_key])
+        stats = cached.get(stats_key)
+        overview = cached.get(overview_key)
+        
+        if stats is None or overview is None:
+            stats = IdeaAnalyticsService._compute_user_stats(
+                user,
+                recent_since=timezone.now() - timedelta(days=7)
+            )
+            overview = {
+                'recent_activity': stats.pop('recent_activity'),
+                **IdeaAnalyticsService._compute_user_overview(user)
+            }
+            
+            # Cache for 15 minutes
+            cache.set_many({stats_key: stats, overview_key: overview}, 900)
         
+        return {'stats': stats, **overview}
+    
+    @staticmethod
+    def _compute_user_overview(user: User) -> Dict[str, Any]:
+        """Compute top ideas and popular templates"""
         # Top rated ideas
-        top_ideas = GeneratedIdea.objects.for_user(user).top_rated(limit=5)
-        
-        # Most used templates
-        template_usage = IdeaRequest.objects.for_user(user).values(
-            'generated_ideas__template_used__name'
+        top_ideas = GeneratedIdea.objects.for_user(user).filter(
+            user_rating__isnull=False
+        ).only(
+            'id', 'title', 'user_rating', 'view_count', 'like_count'
+        ).order_by('-user_rating')[:5]
+        
+        # Most used templates, counted straight from the user's ideas
+        template_usage = GeneratedIdea.objects.for_user(user).filter(
+            template_used__isnull=False
+        ).values(
+            'template_used_id',
+            'template_used__name'
         ).annotate(
-            usage_count=Count('generated_ideas__template_used')
+            usage_count=Count('id')
         ).order_by('-usage_count')[:5]
         
         return {
-            'stats': stats,
-            'recent_activity': {
-                'requests_this_week': recent_requests.count(),
-                'ideas_this_week': recent_ideas.count(),
-            },
             'top_rated_ideas': [
                 {
                     'id': idea.id,
@@ -669,10 +991,10 @@ class IdeaAnalyticsService:
             ],
             'popular_templates': [
                 {
-                    'name': item['generated_ideas__template_used__name'],
+                    'name': item['template_used__name'],
                     'usage_count': item['usage_count']
                 }
-                for item in template_usage if item['generated_ideas__template_used__name']
+                for item in template_usage
             ]
         }
     
@@ -682,40 +1004,26 @@ class IdeaAnalyticsService:
         end_date = timezone.now().date()
         start_date = end_date - timedelta(days=days)
         
-        # Daily request counts
-        daily_requests = IdeaRequest.objects.for_user(user).filter(
+        requests = IdeaRequest.objects.for_user(user).filter(
             created_at__date__range=[start_date, end_date]
-        ).extra(
-            select={'day': 'date(created_at)'}
-        ).values('day').annotate(
-            requests=Count('id'),
-            ideas=Count('generated_ideas')
-        ).order_by('day')
-        
-        # Weekly aggregation for longer periods
+        )
+        
+        # Weekly aggregation for longer periods, daily otherwise; the
+        # buckets are computed by the database either way
         if days > 30:
-            # Group by week
-            weekly_data = {}
-            for item in daily_requests:
-                week_start = item['day'] - timedelta(days=item['day'].weekday())
-                week_key = week_start.strftime('%Y-%m-%d')
-                
-                if week_key not in weekly_data:
-                    weekly_data[week_key] = {'requests': 0, 'ideas': 0}
-                
-                weekly_data[week_key]['requests'] += item['requests']
-                weekly_data[week_key]['ideas'] += item['ideas']
-            
-            trend_data = [
-                {
-                    'date': week_start,
-                    'requests': data['requests'],
-                    'ideas': data['ideas']
-                }
-                for week_start, data in sorted(weekly_data.items())
-            ]
+            trend_data = list(requests.annotate(
+                date=TruncWeek('created_at', output_field=DateField())
+            ).values('date').annotate(
+                requests=Count('id', distinct=True),
+                ideas=Count('generated_ideas')
+            ).order_by('date'))
         else:
-            trend_data = list(daily_requests)
+            trend_data = list(requests.annotate(
+                day=TruncDate('created_at')
+            ).values('day').annotate(
+                requests=Count('id', distinct=True),
+                ideas=Count('generated_ideas')
+            ).order_by('day'))
         
         return {
             'period': f"{days} days",
@@ -757,32 +1065,55 @@ class IdeaAnalyticsService:
     @staticmethod
     def get_global_stats() -> Dict[str, Any]:
         """Get global platform statistics"""
-        cache_key = "global_stats"
+        # Writers bump the revision, so a new key is used after every change
+        cache_key = f"global_stats_v{IdeaCacheService.get_global_stats_revision()}"
         stats = cache.get(cache_key)
         
         if stats is None:
-            total_requests = IdeaRequest.objects.count()
-            total_ideas = GeneratedIdea.objects.count()
-            total_users = User.objects.count()
+            request_stats = IdeaRequest.objects.aggregate(
+                total=Count('id'),
+                completed=Count('id', filter=Q(status='completed', is_deleted=False))
+            )
+            idea_stats = GeneratedIdea.objects.aggregate(
+                total=Count('id'),
+                avg_rating=Avg('user_rating')
+            )
+            total_requests = request_stats['total']
+            total_ideas = idea_stats['total']
             
             stats = {
                 'total_requests': total_requests,
                 'total_ideas': total_ideas,
-                'total_users': total_users,
+                'total_users': User.objects.count(),
                 'average_ideas_per_request': total_ideas / max(total_requests, 1),
-                'most_popular_templates': IdeaTemplate.objects.annotate(
-                    usage=Count('generateidea')
-                ).order_by('-usage').values('name', 'usage')[:5],
-                'average_rating': GeneratedIdea.objects.aggregate(
-                    avg=Avg('user_rating')
-                )['avg'] or 0,
-                'completion_rate': IdeaRequest.objects.completed().count() / max(total_requests, 1) * 100
+                'most_popular_templates': IdeaAnalyticsService.get_popular_templates(),
+                'average_rating': idea_stats['avg_rating'] or 0,
+                'completion_rate': request_stats['completed'] / max(total_requests, 1) * 100
             }
             
-            # Cache for 30 minutes
+            # Cache for 30 minutes at most
             cache.set(cache_key, stats, 1800)
         
         return stats
+    
+    @staticmethod
+    def get_popular_templates() -> List[Dict]:
+        """Get the most used templates, as last summarised by refresh_popular_templates"""
+        templates = cache.get('popular_templates')
+        if templates is None:
+            templates = IdeaAnalyticsService.refresh_popular_templates()
+        return templates
+    
+    @staticmethod
+    def refresh_popular_templates() -> List[Dict]:
+        """Recount template usage over all ideas and store the top five"""
+        templates = list(IdeaTemplate.objects.annotate(
+            usage=Count('generatedidea')
+        ).order_by('-usage').values('name', 'usage')[:5])
+        
+        # Kept until the next refresh, the periodic task runs hourly
+        cache.set('popular_templates', templates, None)
+        return templates
 
 
 class IdeaRatingService:
@@ -809,37 +1140,26 @@ class IdeaRatingService:
             ValidationError: If rating is invalid or idea not found
         """
         try:
-            idea = GeneratedIdea.objects.get(id=idea_id)
-            
             # Validate rating
             if not (1 <= rating <= 5):
                 raise CustomValidationError("Rating must be between 1 and 5")
             
-            # Check if user already rated this idea
-            existing_feedback = IdeaFeedback.objects.filter(
+            idea = GeneratedIdea.objects.only('id').get(id=idea_id)
+            
+            # Create the rating, or lock the user's existing one so the old
+            # value the signals read is the one being replaced. The idea's
+            # rating totals are moved by the IdeaFeedback save receivers.
+            feedback, created = IdeaFeedback.objects.select_for_update().get_or_create(
                 user=user,
                 idea=idea,
-                feedback_type='rating'
-            ).first()
-            
-            if existing_feedback:
-                # Update existing rating
-                existing_feedback.rating = rating
-                existing_feedback.comment = comment
-                existing_feedback.save()
-                feedback = existing_feedback
-            else:
-                # Create new rating
-                feedback = IdeaFeedback.objects.create(
-                    user=user,
-                    idea=idea,
-                    feedback_type='rating',
-                    rating=rating,
-                    comment=comment
-                )
+                feedback_type='rating',
+                defaults={'rating': rating, 'comment': comment}
+            )
             
-            # Update idea's average rating
-            IdeaRatingService._update_idea_rating(idea)
+            if not created:
+                feedback.rating = rating
+                feedback.comment = comment
+                feedback.save(update_fields=['rating', 'comment', 'updated_at'])
             
             # Log rating event
             logger.info(f"User {user.id} rated idea {idea_id} with {rating} stars")
@@ -853,20 +1173,48 @@ class IdeaRatingService:
             raise
     
     @staticmethod
-    def _update_idea_rating(idea: GeneratedIdea) -> None:
-        """Update idea's average rating"""
+    def rating_contribution(feedback_type: str, rating: Optional[int]) -> Tuple[int, int]:
+        """(rating, count) a feedback row adds to its idea's rating totals"""
+        if feedback_type == 'rating' and rating is not None:
+            return rating, 1
+        return 0, 0
+    
+    @staticmethod
+    def _update_idea_rating(idea_id: int, rating_delta: int, count_delta: int) -> None:
+        """
+        Move an idea's rating totals by the given deltas and recompute its
+        average from them in the same UPDATE, without scanning its feedback
+        """
+        rating_sum = F('rating_sum') + rating_delta
+        rating_count = F('rating_count') + count_delta
+        GeneratedIdea.objects.filter(id=idea_id).update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            user_rating=Cast(
+                rating_sum * 1.0 / NullIf(rating_count, 0),
+                output_field=models.DecimalField(max_digits=3, decimal_places=2)
+            )
+        )
+    
+    @staticmethod
+    def rebuild_rating_counters() -> int:
+        """Recompute every idea's rating totals from its feedback"""
         ratings = IdeaFeedback.objects.filter(
-            idea=idea,
+            idea=OuterRef('pk'),
             feedback_type='rating',
             rating__isnull=False
-        ).aggregate(
-            avg_rating=Avg('rating'),
-            count=Count('rating')
+        ).values('idea')
+        rating_sum = Coalesce(Subquery(ratings.annotate(total=Sum('rating')).values('total')), 0)
+        rating_count = Coalesce(Subquery(ratings.annotate(total=Count('rating')).values('total')), 0)
+        
+        return GeneratedIdea.objects.update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            user_rating=Cast(
+                rating_sum * 1.0 / NullIf(rating_count, 0),
+                output_field=models.DecimalField(max_digits=3, decimal_places=2)
+            )
         )
-        
-        if ratings['count'] > 0:
-            idea.user_rating = Decimal(str(round(ratings['avg_rating'], 2)))
-            idea.save(update_fields=['user_rating'])
     
     @staticmethod
     def like_idea(user: User, idea_id: int) -> Tuple[bool, IdeaFeedback]:
@@ -877,29 +1225,27 @@ class IdeaRatingService:
             Tuple of (is_liked, feedback_object)
         """
         try:
-            idea = GeneratedIdea.objects.get(id=idea_id)
-            
-            existing_like = IdeaFeedback.objects.filter(
-                user=user,
-                idea=idea,
-                feedback_type='like'
-            ).first()
+            idea = GeneratedIdea.objects.only('id').get(id=idea_id)
             
-            if existing_like:
-                # Unlike - delete the feedback
-                existing_like.delete()
-                idea.like_count = max(0, idea.like_count - 1)
-                idea.save(update_fields=['like_count'])
-                return False, None
-            else:
-                # Like - create feedback
-                feedback = IdeaFeedback.objects.create(
+            with transaction.atomic():
+                # The unique (user, idea, feedback_type) constraint decides
+                # whether this is a like or an unlike
+                feedback, created = IdeaFeedback.objects.get_or_create(
                     user=user,
                     idea=idea,
                     feedback_type='like'
                 )
-                idea.increment_like_count()
-                return True, feedback
+                ideas = GeneratedIdea.objects.filter(id=idea.id)
+                
+                if created:
+                    # Like - count it atomically
+                    ideas.update(like_count=F('like_count') + 1)
+                    return True, feedback
+                
+                # Unlike - delete the feedback, clamping the count in SQL
+                feedback.delete()
+                ideas.update(like_count=Greatest(F('like_count') - 1, 0))
+                return False, None
                 
         except GeneratedIdea.DoesNotExist:
             raise CustomValidationError(f"Idea {idea_id} not found")
@@ -908,26 +1254,21 @@ class IdeaRatingService:
     def report_idea(user: User, idea_id: int, reason: str, comment: str = '') -> IdeaFeedback:
         """Report an idea for inappropriate content"""
         try:
-            idea = GeneratedIdea.objects.get(id=idea_id)
-            
-            # Check if user already reported this idea
-            existing_report = IdeaFeedback.objects.filter(
-                user=user,
-                idea=idea,
-                feedback_type='report'
-            ).first()
+            idea = GeneratedIdea.objects.only('id').get(id=idea_id)
             
-            if existing_report:
+            # The unique (user, idea, feedback_type) constraint rejects repeat reports
+            try:
+                with transaction.atomic():
+                    feedback = IdeaFeedback.objects.create(
+                        user=user,
+                        idea=idea,
+                        feedback_type='report',
+                        report_reason=reason,
+                        comment=comment
+                    )
+            except IntegrityError:
                 raise CustomValidationError("You have already reported this idea")
             
-            feedback = IdeaFeedback.objects.create(
-                user=user,
-                idea=idea,
-                feedback_type='report',
-                report_reason=reason,
-                comment=comment
-            )
-            
             # Log report for moderation
             logger.warning(f"Idea {idea_id} reported by user {user.id}: {reason}")
             
@@ -951,46 +1292,49 @@ class IdeaBookmarkService:
             Tuple of (is_bookmarked, bookmark_object)
         """
         try:
-            idea = GeneratedIdea.objects.get(id=idea_id)
-            
-            existing_bookmark = IdeaBookmark.objects.filter(
-                user=user,
-                idea=idea
-            ).first()
+            idea = GeneratedIdea.objects.only('id').get(id=idea_id)
             
-            if existing_bookmark:
-                # Remove bookmark
-                existing_bookmark.delete()
+            # Remove bookmark if there is one
+            deleted, _ = IdeaBookmark.objects.filter(user=user, idea=idea).delete()
+            if deleted:
                 return False, None
-            else:
-                # Create bookmark
-                bookmark = IdeaBookmark.objects.create(
-                    user=user,
-                    idea=idea,
-                    notes=notes
-                )
-                return True, bookmark
+            
+            # Create bookmark, the unique (user, idea) constraint guards against doubles
+            try:
+                with transaction.atomic():
+                    bookmark = IdeaBookmark.objects.create(
+                        user=user,
+                        idea=idea,
+                        notes=notes
+                    )
+            except IntegrityError:
+                bookmark = IdeaBookmark.objects.get(user=user, idea=idea)
+            return True, bookmark
                 
         except GeneratedIdea.DoesNotExist:
             raise CustomValidationError(f"Idea {idea_id} not found")
     
     @staticmethod
-    def get_user_bookmarks(user: User, limit: int = 20) -> List[IdeaBookmark]:
-        """Get user's bookmarked ideas"""
-        return IdeaBookmark.objects.filter(
+    def get_user_bookmarks(user: User, limit: Optional[int] = 20) -> models.QuerySet:
+        """
+        Get user's bookmarked ideas. Pass limit=None to get the unsliced
+        queryset, e.g. for DRF pagination to apply LIMIT/OFFSET in SQL.
+        """
+        bookmarks = IdeaBookmark.objects.filter(
             user=user
-        ).select_related('idea', 'idea__request').order_by('-created_at')[:limit]
+        ).select_related('idea').only(
+            'id', 'created_at', 'notes', 'user_id',
+            'idea__id', 'idea__title', 'idea__description', 'idea__user_rating', 'idea__request'
+        ).order_by('-created_at')
+        return bookmarks if limit is None else bookmarks[:limit]
     
     @staticmethod
     def update_bookmark_notes(user: User, bookmark_id: int, notes: str) -> IdeaBookmark:
         """Update bookmark notes"""
-        try:
-            bookmark = IdeaBookmark.objects.get(id=bookmark_id, user=user)
-            bookmark.notes = notes
-            bookmark.save(update_fields=['notes'])
-            return bookmark
-        except IdeaBookmark.DoesNotExist:
+        # Ownership check and write in a single UPDATE
+        if not IdeaBookmark.objects.filter(id=bookmark_id, user=user).update(notes=notes):
             raise CustomValidationError("Bookmark not found")
+        return IdeaBookmark.objects.get(id=bookmark_id)
 
 
 class IdeaRecommendationService:
@@ -1003,72 +1347,117 @@ class IdeaRecommendationService:
         """
         Get personalized recommendations for a user
         """
-        # Get user's interaction history
-        user_ratings = IdeaFeedback.objects.filter(
+        # Ideas the user already rated highly or bookmarked, kept as subqueries
+        rated_ideas = IdeaFeedback.objects.filter(
             user=user,
             feedback_type='rating',
             rating__gte=4
-        ).values_list('idea_id', flat=True)
+        ).values('idea_id')
         
-        user_bookmarks = IdeaBookmark.objects.filter(
+        bookmarked_ideas = IdeaBookmark.objects.filter(
             user=user
-        ).values_list('idea_id', flat=True)
-        
-        # Get user's preferred templates
-        user_requests = IdeaRequest.objects.filter(user=user)
-        preferred_categories = user_requests.values_list(
-            'generated_ideas__template_used__category',
-            flat=True
-        ).distinct()
-        
-        # Build recommendation query
-        recommendations = GeneratedIdea.objects.exclude(
-            id__in=list(user_ratings) + list(user_bookmarks)
+        ).values('idea_id')
+        
+        # Precomputed categories the user engages with, best first
+        preferred_categories = IdeaRecommendationService.get_taste_profile(user.id)
+        
+        candidates = GeneratedIdea.objects.exclude(
+            id__in=rated_ideas
+        ).exclude(
+            id__in=bookmarked_ideas
         ).exclude(
             request__user=user  # Don't recommend user's own ideas
-        ).filter(
-            user_rating__gte=4.0,  # High-rated ideas
-            template_used__category__in=preferred_categories
-        ).order_by('-user_rating', '-like_count')[:limit]
+        ).select_related('template_used__category', 'request')
+        
+        # Build recommendation query, ranking ideas by how strongly the
+        # user prefers their category
+        recommendations = []
+        if preferred_categories:
+            recommendations = list(candidates.filter(
+                user_rating__gte=4.0,  # High-rated ideas
+                template_used__category_id__in=preferred_categories
+            ).annotate(
+                category_rank=Case(
+                    *[When(template_used__category_id=category_id, then=Value(rank))
+                      for rank, category_id in enumerate(preferred_categories)],
+                    output_field=IntegerField()
+                )
+            ).order_by('category_rank', '-user_rating', '-like_count')[:limit])
         
         # If not enough recommendations, fall back to popular ideas
         if len(recommendations) < limit:
-            popular_ideas = GeneratedIdea.objects.exclude(
-                id__in=list(user_ratings) + list(user_bookmarks)
-            ).exclude(
-                request__user=user
+            popular_ideas = candidates.exclude(
+                id__in=[idea.id for idea in recommendations]
             ).order_by('-like_count', '-view_count')[:(limit - len(recommendations))]
             
-            recommendations = list(recommendations) + list(popular_ideas)
+            recommendations.extend(popular_ideas)
         
         return recommendations
     
+    @staticmethod
+    def get_taste_profile(user_id: int) -> List:
+        """Get the user's preferred categories, building them on a cache miss"""
+        profile = cache.get(f"user_taste_profile_{user_id}")
+        if profile is None:
+            profile = IdeaRecommendationService.build_taste_profile(user_id)
+        return profile
+    
+    @staticmethod
+    def build_taste_profile(user_id: int) -> List:
+        """
+        Rank the categories a user engages with and cache the top ones.
+        Categories of the user's own ideas count once per idea, highly
+        rated and bookmarked ideas twice.
+        """
+        weights = Counter()
+        engagement = (
+            (GeneratedIdea.objects.filter(request__user_id=user_id), 'template_used__category_id', 1),
+            (IdeaFeedback.objects.filter(user_id=user_id, feedback_type='rating', rating__gte=4),
+             'idea__template_used__category_id', 2),
+            (IdeaBookmark.objects.filter(user_id=user_id), 'idea__template_used__category_id', 2),
+        )
+        for queryset, category_field, weight in engagement:
+            for row in queryset.filter(**{f"{category_field}__isnull": False}).values(
+                category_field
+            ).annotate(count=Count('id')):
+                weights[row[category_field]] += row['count'] * weight
+        
+        profile = [category_id for category_id, _ in weights.most_common(TASTE_PROFILE_SIZE)]
+        cache.set(f"user_taste_profile_{user_id}", profile, 86400)
+        return profile
+    
     @staticmethod
     def get_similar_ideas(idea_id: int, limit: int = 5) -> List[GeneratedIdea]:
         """Get ideas similar to a given idea"""
         try:
-            idea = GeneratedIdea.objects.get(id=idea_id)
+            idea = GeneratedIdea.objects.values(
+                'template_used_id', 'template_used__category_id'
+            ).get(id=idea_id)
+            template_id = idea['template_used_id']
             
-            # Find similar ideas based on template and category
-            similar_ideas = GeneratedIdea.objects.filter(
-                template_used=idea.template_used
-            ).exclude(
-                id=idea_id
-            ).order_by('-user_rating', '-like_count')[:limit]
-            
-            # If not enough similar ideas, expand to same category
-            if len(similar_ideas) < limit and idea.template_used:
-                category_ideas = GeneratedIdea.objects.filter(
-                    template_used__category=idea.template_used.category
+            if template_id is None:
+                # Without a template only other untemplated ideas match
+                return list(GeneratedIdea.objects.filter(
+                    template_used__isnull=True
                 ).exclude(
                     id=idea_id
-                ).exclude(
-                    id__in=[i.id for i in similar_ideas]
-                ).order_by('-user_rating', '-like_count')[:(limit - len(similar_ideas))]
-                
-                similar_ideas = list(similar_ideas) + list(category_ideas)
+                ).order_by('-user_rating', '-like_count')[:limit])
             
-            return similar_ideas
+            # Find similar ideas based on template, then the same category
+            return list(GeneratedIdea.objects.filter(
+                Q(template_used_id=template_id) |
+                Q(template_used__category_id=idea['template_used__category_id'])
+            ).exclude(
+                id=idea_id
+            ).annotate(
+                match_rank=Case(
+                    When(template_used_id=template_id, then=Value(0)),
+                    default=Value(1),
+                    output_field=IntegerField()
+                )
+            ).select_related(
+                'template_used'
+            ).order_by('match_rank', '-user_rating', '-like_count')[:limit])
             
         except GeneratedIdea.DoesNotExist:
             return []
@@ -1089,10 +1478,13 @@ class IdeaSearchService:
         min_rating: float = 0.0,
         user: User = None,
         limit: int = 20,
-        offset: int = 0
+        cursor: Optional[Tuple] = None
     ) -> Dict[str, Any]:
         """
         Search ideas with various filters
+        
+        Pages are keyset paginated: pass the previous page's next_cursor as
+        cursor to continue. total_count is only computed for the first page.
         """
         # Base queryset
         ideas = GeneratedIdea.objects.select_related(
@@ -1131,17 +1523,36 @@ class IdeaSearchService:
         if user and user.is_authenticated:
             ideas = ideas.exclude(request__user=user)
         
-        # Get total count
-        total_count = ideas.count()
+        # Apply ordering, with id as tiebreaker so the cursor is unambiguous
+        ideas = ideas.order_by('-user_rating', '-like_count', '-id')
+        
+        if cursor:
+            # Seek past the previous page instead of reading and discarding it
+            last_rating, last_like_count, last_id = cursor
+            ideas = ideas.filter(
+                Q(user_rating__lt=last_rating) |
+                Q(user_rating=last_rating, like_count__lt=last_like_count) |
+                Q(user_rating=last_rating, like_count=last_like_count, id__lt=last_id)
+            )
+            total_count = None
+        else:
+            # Total count computed by a window over the same filtered rows
+            # instead of a separate COUNT
+            ideas = ideas.annotate(total_count=Window(expression=Count('id')))
+        
+        # Fetch one extra row to know whether there is a next page
+        page = list(ideas[:limit + 1])
+        has_more = len(page) > limit
+        page = page[:limit]
         
-        # Apply pagination and ordering
-        ideas = ideas.order_by('-user_rating', '-like_count')[offset:offset + limit]
+        if not cursor:
+            total_count = page[0].total_count if page else 0
         
         return {
-            'ideas': list(ideas),
+            'ideas': page,
             'total_count': total_count,
-            'has_more': (offset + limit) < total_count,
-            'next_offset': offset + limit if (offset + limit) < total_count else None
+            'has_more': has_more,
+            'next_cursor': (page[-1].user_rating, page[-1].like_count, page[-1].id) if has_more else None
         }
     
     @staticmethod
@@ -1151,18 +1562,20 @@ class IdeaSearchService:
         
         return GeneratedIdea.objects.filter(
             created_at__gte=cutoff_date
-        ).annotate(
-            engagement_score=F('like_count') * 2 + F('view_count') + F('share_count') * 3
         ).order_by('-engagement_score', '-user_rating')[:limit]
     
     @staticmethod
-    def get_popular_ideas(limit: int = 10) -> List[GeneratedIdea]:
-        """Get most popular ideas of all time"""
-        return GeneratedIdea.objects.order_by(
+    def get_popular_ideas(limit: Optional[int] = 10) -> models.QuerySet:
+        """
+        Get most popular ideas of all time. Pass limit=None to get the unsliced
+        queryset, e.g. for DRF pagination to apply LIMIT/OFFSET in SQL.
+        """
+        ideas = GeneratedIdea.objects.order_by(
             '-like_count',
             '-view_count',
             '-user_rating'
-        )[:limit]
+        )
+        return ideas if limit is None else ideas[:limit]
 
 
 class IdeaCacheService:
@@ -1171,25 +1584,27 @@ class IdeaCacheService:
     """
     
     @staticmethod
-    def get_cached_idea(idea_id: int) -> Optional[GeneratedIdea]:
+    def get_cached_idea(idea_id: int) -> Optional[CachedIdea]:
         """Get idea from cache or database"""
         cache_key = f"idea_{idea_id}"
-        idea = cache.get(cache_key)
+        data = cache.get(cache_key)
         
-        if idea is None:
+        if data is None:
+            # Cache a plain dict of the columns rather than a model instance
             try:
-                idea = GeneratedIdea.objects.select_related(
-                    'request',
-                    'template_used',
-                    'template_used__category'
+                data = GeneratedIdea.objects.values(
+                    'id', 'request_id', 'title', 'description', 'detailed_plan',
+                    'user_rating', 'like_count', 'view_count', 'template_used_id',
+                    template_name=F('template_used__name'),
+                    category_name=F('template_used__category__name')
                 ).get(id=idea_id)
                 
                 # Cache for 1 hour
-                cache.set(cache_key, idea, 3600)
+                cache.set(cache_key, data, 3600)
             except GeneratedIdea.DoesNotExist:
                 return None
         
-        return idea
+        return CachedIdea(**data)
     
     @staticmethod
     def invalidate_idea_cache(idea_id: int) -> None:
@@ -1197,6 +1612,67 @@ class IdeaCacheService:
         cache_key = f"idea_{idea_id}"
         cache.delete(cache_key)
     
+    @staticmethod
+    def get_global_stats_revision() -> int:
+        """Get the current revision of the global stats cache"""
+        return cache.get_or_set('global_stats_rev', lambda: int(time.time()), None)
+    
+    @staticmethod
+    def bump_global_stats_revision() -> None:
+        """Move the global stats cache to a new revision"""
+        if _GLOBAL_STATS_BUMP_DEFERRED.get():
+            return
+        try:
+            cache.incr('global_stats_rev')
+        except ValueError:
+            # Start from the clock so an evicted revision is never reused
+            cache.set('global_stats_rev', int(time.time()), None)
+    
+    @staticmethod
+    @contextmanager
+    def global_stats_bulk_change():
+        """
+        Bump the global stats revision once for every write inside the block,
+        instead of once per saved or deleted row
+        """
+        token = _GLOBAL_STATS_BUMP_DEFERRED.set(True)
+        try:
+            yield
+        finally:
+            _GLOBAL_STATS_BUMP_DEFERRED.reset(token)
+            IdeaCacheService.bump_global_stats_revision()
+    
+    @staticmethod
+    def get_ai_model_config_revision() -> int:
+        """Get the current revision of the per-process AI model config caches"""
+        return cache.get_or_set('ai_model_config_rev', lambda: int(time.time()), None)
+    
+    @staticmethod
+    def bump_ai_model_config_revision() -> None:
+        """Move every process to a new AI model config cache revision"""
+        try:
+            cache.incr('ai_model_config_rev')
+        except ValueError:
+            cache.set('ai_model_config_rev', int(time.time()), None)
+    
+    @staticmethod
+    def request_count_keys(user_id: int, day) -> Tuple[str, str]:
+        """Cache keys of the user's daily and monthly request counters"""
+        return (
+            f"request_count_daily_{user_id}_{day:%Y%m%d}",
+            f"request_count_monthly_{user_id}_{day:%Y%m}"
+        )
+    
+    @staticmethod
+    def increment_request_counts(user_id: int, day) -> None:
+        """Count a new request in the user's daily and monthly counters"""
+        for cache_key in IdeaCacheService.request_count_keys(user_id, day):
+            try:
+                cache.incr(cache_key)
+            except ValueError:
+                # Cold counter, backfilled from the database on the next limit check
+                pass
+    
     @staticmethod
     def get_cached_user_stats(user_id: int) -> Optional[Dict]:
         """Get cached user statistics"""
@@ -1250,11 +1726,11 @@ class IdeaValidationService:
             validation_results['warnings'].append("Description is very long")
         
         # Check for inappropriate content (basic filtering)
-        inappropriate_keywords = ['violence', 'illegal', 'drugs', 'alcohol abuse']
         content_to_check = f"{title} {description}".lower()
+        found_keywords = set(INAPPROPRIATE_KEYWORD_PATTERN.findall(content_to_check))
         
-        for keyword in inappropriate_keywords:
-            if keyword in content_to_check:
+        for keyword in INAPPROPRIATE_KEYWORDS:
+            if keyword in found_keywords:
                 validation_results['issues'].append(f"Potentially inappropriate content detected: {keyword}")
                 validation_results['is_valid'] = False
         
@@ -1266,31 +1742,17 @@ class IdeaValidationService:
     @staticmethod
     def _calculate_content_quality(idea_data: Dict) -> float:
         """Calculate content quality score"""
-        score = 0.0
-        
-        # Title quality
-        title = idea_data.get('title', '')
-        if 10 <= len(title) <= 100:
-            score += 1.0
-        elif title:
-            score += 0.5
-        
-        # Description quality
-        description = idea_data.get('description', '')
-        if len(description) >= 100:
-            score += 2.0
-        elif len(description) >= 50:
-            score += 1.0
-        
-        # Detailed plan
-        if idea_data.get('detailed_plan'):
-            score += 1.0
-        
-        # Cost and duration info
-        if idea_data.get('estimated_cost'):
-            score += 0.5
-        if idea_data.get('duration'):
-            score += 0.5
+        title_length = len(idea_data.get('title', ''))
+        description_length = len(idea_data.get('description', ''))
+        
+        score = (
+            CONTENT_TITLE_POINTS[bisect_right(CONTENT_TITLE_LENGTH_THRESHOLDS, title_length)]
+            + CONTENT_DESCRIPTION_POINTS[bisect_right(CONTENT_DESCRIPTION_LENGTH_THRESHOLDS, description_length)]
+            # Detailed plan, cost and duration info
+            + (1.0 if idea_data.get('detailed_plan') else 0.0)
+            + (0.5 if idea_data.get('estimated_cost') else 0.0)
+            + (0.5 if idea_data.get('duration') else 0.0)
+        )
         
         return min(score, 5.0)
     
@@ -1315,19 +1777,27 @@ class IdeaValidationService:
                 daily_limit = 100
                 monthly_limit = 1000
         
-        # Check current usage
+        # Check current usage from the request counters, kept up to date on request creation
         today = timezone.now().date()
         current_month_start = today.replace(day=1)
+        daily_key, monthly_key = IdeaCacheService.request_count_keys(user.id, today)
+        counters = cache.get_many([daily_key, monthly_key])
         
-        daily_usage = IdeaRequest.objects.filter(
-            user=user,
-            created_at__date=today
-        ).count()
+        daily_usage = counters.get(daily_key)
+        if daily_usage is None:
+            daily_usage = IdeaRequest.objects.filter(
+                user=user,
+                created_at__date=today
+            ).count()
+            cache.add(daily_key, daily_usage, 86400)
         
-        monthly_usage = IdeaRequest.objects.filter(
-            user=user,
-            created_at__date__gte=current_month_start
-        ).count()
+        monthly_usage = counters.get(monthly_key)
+        if monthly_usage is None:
+            monthly_usage = IdeaRequest.objects.filter(
+                user=user,
+                created_at__date__gte=current_month_start
+            ).count()
+            cache.add(monthly_key, monthly_usage, 32 * 86400)
         
         return {
             'can_make_request': daily_usage < daily_limit and monthly_usage < monthly_limit,
@@ -1343,38 +1813,45 @@ class IdeaValidationService:
 def log_idea_interaction(user: User, idea: GeneratedIdea, interaction_type: str, metadata: Dict = None):
     """Log user interactions with ideas for analytics"""
     try:
-        from .tasks import log_interaction_async
-        log_interaction_async.delay(
-            user_id=user.id,
-            idea_id=idea.id,
-            interaction_type=interaction_type,
-            metadata=metadata or {}
-        )
+        queue_interaction(user.id, idea.id, interaction_type, metadata)
     except Exception as e:
         logger.error(f"Failed to log interaction: {str(e)}")
 
 
+def queue_interaction(user_id, idea_id, interaction_type: str, metadata: Dict = None):
+    """Append an interaction to the stream drained by tasks.drain_interactions"""
+    get_redis_connection('default').xadd(
+        INTERACTION_STREAM_KEY,
+        {
+            'user_id': str(user_id),
+            'idea_id': str(idea_id),
+            'interaction_type': interaction_type,
+            'metadata': json.dumps(metadata or {})
+        },
+        maxlen=INTERACTION_STREAM_MAXLEN,
+        approximate=True
+    )
+
+
 def get_user_preference_keywords(user: User) -> List[str]:
     """Extract keywords from user's past requests for personalization"""
-    requests = IdeaRequest.objects.filter(user=user).order_by('-created_at')[:10]
-    
-    keywords = []
-    for request in requests:
-        # Extract keywords from various fields
-        text_fields = [
-            request.occasion,
-            request.partner_interests,
-            request.user_interests,
-            request.special_requirements
-        ]
+    cache_key = f"user_preference_keywords_{user.id}"
+    keywords = cache.get(cache_key)
+    
+    if keywords is None:
+        # Only the four text columns of the last 10 requests are needed
+        rows = IdeaRequest.objects.filter(user=user).order_by('-created_at').values_list(
+            'occasion', 'partner_interests', 'user_interests', 'special_requirements'
+        )[:10]
+        
+        # Simple keyword extraction (in production, use NLP libraries)
+        text = ' '.join(field for row in rows for field in row if field).lower()
+        counts = Counter(word for word in PREFERENCE_WORD_PATTERN.findall(text) if len(word) > 3)
+        
+        # Return most common keywords
+        keywords = [keyword for keyword, count in counts.most_common(20) if count > 1]
         
-        for field in text_fields:
-            if field:
-                # Simple keyword extraction (in production, use NLP libraries)
-                words = re.findall(r'\b\w+\b', field.lower())
-                keywords.extend([word for word in words if len(word) > 3])
+        # Cache for 1 hour
+        cache.set(cache_key, keywords, 3600)
     
-    # Return most common keywords
-    from collections import Counter
-    common_keywords = Counter(keywords).most_common(20)
-    return [keyword for keyword, count in common_keywords if count > 1]
\ No newline at end of file
+    return keywords
@@ -0,0 +1,101 @@
+# apps/ideas/signals.py
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from .models import AIModelConfiguration, GeneratedIdea, IdeaBookmark, IdeaFeedback, IdeaRequest
+from .services import IdeaCacheService, IdeaRatingService, _load_ai_model_config
+from .tasks import _load_ai_model_configs, refresh_user_taste_profile
+import logging
+
+logger = logging.getLogger(__name__)
+
+@receiver(post_save, sender=AIModelConfiguration)
+@receiver(post_delete, sender=AIModelConfiguration)
+def clear_ai_model_config_cache(sender, instance, **kwargs):
+    """Drop cached AI model configurations when one changes"""
+    _load_ai_model_config.cache_clear()
+    _load_ai_model_configs.cache_clear()
+    # Other processes notice the new revision on their next lookup
+    IdeaCacheService.bump_ai_model_config_revision()
+    logger.info(f"Cleared AI model configuration cache after change to {instance.name}")
+
+@receiver(pre_save, sender=IdeaFeedback)
+def remember_previous_rating(sender, instance, raw=False, **kwargs):
+    """Read the stored feedback row so post_save can move the totals by the difference"""
+    instance._previous_rating = None
+    if raw or instance._state.adding:
+        return
+    instance._previous_rating = IdeaFeedback.objects.filter(pk=instance.pk).values_list(
+        'idea_id', 'feedback_type', 'rating'
+    ).first()
+
+@receiver(post_save, sender=IdeaFeedback)
+def apply_rating_change(sender, instance, raw=False, **kwargs):
+    """Move the idea's rating totals for every rating create and update"""
+    if raw:
+        return
+    new_sum, new_count = IdeaRatingService.rating_contribution(instance.feedback_type, instance.rating)
+    previous = getattr(instance, '_previous_rating', None)
+    instance._previous_rating = None
+    
+    if previous is None:
+        if new_count:
+            IdeaRatingService._update_idea_rating(instance.idea_id, new_sum, new_count)
+        return
+    
+    old_idea_id, old_type, old_rating = previous
+    old_sum, old_count = IdeaRatingService.rating_contribution(old_type, old_rating)
+    if old_idea_id != instance.idea_id:
+        if old_count:
+            IdeaRatingService._update_idea_rating(old_idea_id, -old_sum, -old_count)
+        if new_count:
+            IdeaRatingService._update_idea_rating(instance.idea_id, new_sum, new_count)
+    elif (new_sum, new_count) != (old_sum, old_count):
+        IdeaRatingService._update_idea_rating(
+            instance.idea_id, new_sum - old_sum, new_count - old_count
+        )
+
+@receiver(post_delete, sender=IdeaFeedback)
+def remove_deleted_rating(sender, instance, **kwargs):
+    """Take a deleted rating out of the idea's rating totals"""
+    rating_sum, rating_count = IdeaRatingService.rating_contribution(instance.feedback_type, instance.rating)
+    if rating_count:
+        IdeaRatingService._update_idea_rating(instance.idea_id, -rating_sum, -rating_count)
+
+@receiver(post_save, sender=IdeaRequest)
+def count_new_request(sender, instance, created, **kwargs):
+    """Keep the user's request limit counters in step with new requests"""
+    if created:
+        IdeaCacheService.increment_request_counts(instance.user_id, instance.created_at.date())
+
+# Fields read by IdeaAnalyticsService.get_global_stats, per model
+GLOBAL_STATS_FIELDS = {
+    IdeaRequest: frozenset({'status', 'is_deleted'}),
+    GeneratedIdea: frozenset({'user_rating'}),
+}
+
+@receiver(post_save, sender=IdeaRequest)
+@receiver(post_save, sender=GeneratedIdea)
+def invalidate_global_stats_on_save(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """Move global stats to a new cache revision when a counted row or field changes"""
+    if raw:
+        return
+    # A save without update_fields may have changed any field
+    if created or update_fields is None or not GLOBAL_STATS_FIELDS[sender].isdisjoint(update_fields):
+        IdeaCacheService.bump_global_stats_revision()
+
+@receiver(post_delete, sender=IdeaRequest)
+@receiver(post_delete, sender=GeneratedIdea)
+def invalidate_global_stats_on_delete(sender, instance, **kwargs):
+    """Move global stats to a new cache revision when a counted row is deleted"""
+    IdeaCacheService.bump_global_stats_revision()
+
+@receiver(post_save, sender=IdeaFeedback)
+@receiver(post_save, sender=IdeaBookmark)
+@receiver(post_delete, sender=IdeaBookmark)
+def refresh_taste_profile(sender, instance, **kwargs):
+    """Rebuild the user's taste profile after ratings and bookmarks change"""
+    if sender is IdeaFeedback and instance.feedback_type != 'rating':
+        return
+    user_id = instance.user_id
+    transaction.on_commit(lambda: refresh_user_taste_profile.delay(user_id))
@@ -1,34 +1,72 @@
 # apps/ideas/tasks.py
 import logging
 import json
+import smtplib
+import time
 import traceback
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from celery import shared_task, chain, group, chord
 from celery.exceptions import Retry, MaxRetriesExceededError
 from django.conf import settings
-from django.db import transaction, IntegrityError
-from django.db.models import F, Q, Avg, Count, Sum
+from django.db import connection, connections, transaction, IntegrityError
+from django.db.models import F, Q, Avg, Case, Count, IntegerField, Sum, When
 from django.utils import timezone
 from django.core.cache import cache
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template.loader import get_template
 from django.contrib.auth import get_user_model
+from django_redis import get_redis_connection
+from redis.exceptions import LockNotOwnedError, ResponseError
 
 from core.exceptions import ServiceUnavailableError, ValidationError
 from .models import (
     IdeaRequest, GeneratedIdea, IdeaTemplate, IdeaFeedback,
     IdeaUsageStats, AIModelConfiguration, IdeaCategory
 )
-from .services import IdeaGenerationService, IdeaAnalyticsService
+from .services import (
+    IdeaGenerationService, IdeaAnalyticsService, IdeaCacheService, IdeaRecommendationService,
+    GeneratedIdeaResult, INTERACTION_STREAM_KEY, INTERACTION_STREAM_MAXLEN, queue_interaction
+)
 from .ai_client import AIClient
 from .prompt_templates import PromptTemplateEngine
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the ideas generated on threads in one worker
+IDEA_GENERATION_THREAD_TIMEOUT = 300
+
+# Redis sorted set of pending feedback reminders, scored by when they are due
+FEEDBACK_REMINDERS_KEY = 'feedback_reminders'
+
+# Rows deleted per statement by cleanup_old_data, to keep each lock short
+CLEANUP_CHUNK_SIZE = 10000
+
+# Consumer group draining the interaction stream, and the counter each interaction bumps
+INTERACTION_CONSUMER_GROUP = 'interaction_writers'
+INTERACTION_COUNTER_FIELDS = {
+    'view': 'view_count',
+    'like': 'like_count',
+    'share': 'share_count',
+    'pdf_download': 'pdf_download_count',
+}
+
+# A drain run stops well before its lock expires, so two runs never read the
+# stream under the same consumer at once; the beat schedule picks up the rest
+INTERACTION_DRAIN_LOCK_TIMEOUT = 60
+INTERACTION_DRAIN_MAX_SECONDS = 20
+
+# Stream keeping the entries that could not be applied, for inspection
+INTERACTION_DEAD_LETTER_KEY = f"{INTERACTION_STREAM_KEY}:dead"
+
 
 # ==============================================================================
 # MAIN IDEA GENERATION TASKS
@@ -54,64 +92,10 @@ def generate_ideas_async(self, request_id: int) -> Dict[str, Any]:
             logger.error(f"IdeaRequest {request_id} does not exist")
             return {'success': False, 'error': 'Request not found'}
 
-        # Mark as processing
-        idea_request.mark_as_processing()
-        
-        logger.info(f"Starting idea generation for request {request_id}")
-
-        # Initialize services
-        generation_service = IdeaGenerationService()
-        ai_client = AIClient()
-        
-        # Check if AI service is available
-        if not ai_client.is_service_available():
-            raise ServiceUnavailableError("AI service is currently unavailable")
-
         # Get AI model configuration
         model_config = _get_ai_model_config(idea_request.ai_model)
-        if not model_config:
-            raise ValidationError(f"AI model {idea_request.ai_model} not configured")
-
-        # Prepare generation request
-        generation_request = _prepare_generation_request(idea_request)
         
-        # Generate ideas
-        with transaction.atomic():
-            # Use chord pattern for parallel generation if multiple ideas needed
-            ideas_count = _get_ideas_count_for_user(idea_request.user)
-            
-            if ideas_count > 1:
-                # Generate multiple ideas in parallel
-                result = _generate_multiple_ideas_parallel(
-                    generation_request, 
-                    ideas_count,
-                    model_config
-                )
-            else:
-                # Generate single idea
-                result = _generate_single_idea(
-                    generation_request,
-                    model_config
-                )
-
-            # Mark request as completed
-            idea_request.mark_as_completed()
-            
-            # Schedule post-generation tasks
-            _schedule_post_generation_tasks.delay(
-                request_id=request_id,
-                ideas_generated=len(result.get('ideas', [])),
-                user_id=idea_request.user.id
-            )
-
-        logger.info(f"Successfully generated {len(result.get('ideas', []))} ideas for request {request_id}")
-        
-        return {
-            'success': True,
-            'request_id': request_id,
-            'ideas_generated': len(result.get('ideas', [])),
-            'processing_time': idea_request.get_processing_time()
-        }
+        return _run_idea_generation(idea_request, model_config)
 
     except Exception as exc:
         # Handle failures
@@ -146,13 +130,13 @@ def generate_single_idea_task(self, generation_request_data: Dict, model_config_
         from .services import IdeaGenerationRequest
         generation_request = IdeaGenerationRequest(**generation_request_data)
         
-        # Generate the idea
-        result = generation_service.generate_ideas(generation_request, model_config_data)
+        # Generate the ideas, returned as plain dicts for the JSON result backend
+        ideas = generation_service.generate_ideas(generation_request)
         
         return {
             'success': True,
-            'idea': result,
-            'tokens_used': result.generation_tokens if hasattr(result, 'generation_tokens') else 0
+            'ideas': [asdict(idea) for idea in ideas],
+            'tokens_used': sum(idea.generation_tokens for idea in ideas)
         }
         
     except Exception as exc:
@@ -162,31 +146,85 @@ def generate_single_idea_task(self, generation_request_data: Dict, model_config_
         return {'success': False, 'error': str(exc)}
 
 
+@shared_task
+def assemble_ideas(results: List[Dict], request_id: int) -> Dict[str, Any]:
+    """
+    Chord callback for parallel generation: complete the request once all
+    single idea tasks have finished
+    """
+    try:
+        idea_request = IdeaRequest.objects.select_related('user').get(id=request_id)
+    except IdeaRequest.DoesNotExist:
+        logger.error(f"IdeaRequest {request_id} does not exist")
+        return {'success': False, 'error': 'Request not found'}
+    
+    ideas = [
+        GeneratedIdeaResult(**idea)
+        for result in results if result.get('success')
+        for idea in result.get('ideas', [])
+    ]
+    
+    if not ideas:
+        error_message = "Failed to generate any ideas"
+        idea_request.mark_as_failed(error_message)
+        _notify_generation_failed.delay(request_id, error_message)
+        return {'success': False, 'request_id': request_id, 'error': error_message}
+    
+    with transaction.atomic():
+        saved_ideas = IdeaGenerationService().create_ideas(idea_request, ideas)
+        ideas_generated = len(saved_ideas)
+        _complete_idea_generation(idea_request, ideas_generated)
+    
+    return {
+        'success': True,
+        'request_id': request_id,
+        'ideas_generated': ideas_generated,
+        'processing_time': idea_request.get_processing_time()
+    }
+
+
+@shared_task
+def mark_generation_failed(task_request, exc, tb, request_id: int):
+    """
+    Error callback for the parallel generation chord: a failed header task
+    or assemble_ideas would otherwise leave the request processing forever
+    """
+    error_message = str(exc)
+    logger.error(f"Parallel generation failed for request {request_id}: {error_message}")
+    
+    try:
+        idea_request = IdeaRequest.objects.get(id=request_id)
+    except IdeaRequest.DoesNotExist:
+        return
+    
+    if idea_request.status != 'completed':
+        idea_request.mark_as_failed(error_message)
+        _notify_generation_failed.delay(request_id, error_message)
+
+
 # ==============================================================================
 # POST-GENERATION TASKS
 # ==============================================================================
 
-@shared_task
+@shared_task(queue='analytics')
 def _schedule_post_generation_tasks(request_id: int, ideas_generated: int, user_id: int):
     """
-    Schedule all post-generation tasks using Celery's workflow patterns
+    Run all post-generation work in this worker. Each step is a small update
+    that logs its own failures, so calling the tasks inline saves a broker
+    round trip per step. The feedback reminder is only recorded here, in the
+    feedback_reminders sorted set; sweep_feedback_reminders sends it once due.
     """
-    # Create a group of independent tasks
-    post_tasks = group(
-        update_usage_stats.s(user_id, ideas_generated),
-        update_template_usage_stats.s(request_id),
-        cache_user_recent_ideas.s(user_id),
-        analyze_content_quality.s(request_id),
-        schedule_feedback_reminder.s(user_id, request_id)
-    )
+    update_usage_stats(user_id, ideas_generated)
+    update_template_usage_stats(request_id)
+    cache_user_recent_ideas(user_id)
+    refresh_user_taste_profile(user_id)
+    analyze_content_quality(request_id)
+    schedule_feedback_reminder(user_id, request_id)
     
-    # Execute all tasks in parallel
-    job = post_tasks.apply_async()
-    logger.info(f"Scheduled post-generation tasks for request {request_id}")
-    return job.id
+    logger.info(f"Ran post-generation tasks for request {request_id}")
 
 
-@shared_task
+@shared_task(queue='analytics')
 def update_usage_stats(user_id: int, ideas_generated: int, tokens_used: int = 0, model_used: str = ""):
     """
     Update daily usage statistics
@@ -194,39 +232,19 @@ def update_usage_stats(user_id: int, ideas_generated: int, tokens_used: int = 0,
     try:
         today = timezone.now().date()
         
-        with transaction.atomic():
-            stats, created = IdeaUsageStats.objects.get_or_create(
-                date=today,
-                defaults={
-                    'total_requests': 0,
-                    'successful_generations': 0,
-                    'failed_generations': 0,
-                    'total_users': 0,
-                    'free_tier_requests': 0,
-                    'premium_requests': 0,
-                    'total_tokens_used': 0
-                }
-            )
-            
-            # Update stats
-            stats.total_requests = F('total_requests') + 1
-            stats.successful_generations = F('successful_generations') + ideas_generated
-            stats.total_tokens_used = F('total_tokens_used') + tokens_used
-            
-            # Check user subscription tier
-            try:
-                user = User.objects.select_related('subscription').get(id=user_id)
-                if hasattr(user, 'subscription') and user.subscription.is_active:
-                    stats.premium_requests = F('premium_requests') + 1
-                else:
-                    stats.free_tier_requests = F('free_tier_requests') + 1
-            except User.DoesNotExist:
-                stats.free_tier_requests = F('free_tier_requests') + 1
-            
-            stats.save()
-            
-            # Update unique users count (done separately to avoid complex F expressions)
-            _update_daily_unique_users.delay(today.isoformat(), user_id)
+        # Check user subscription tier
+        tier_field = 'premium_requests' if _is_premium_user(user_id) else 'free_tier_requests'
+        
+        # Update stats
+        _upsert_usage_stats(today, {
+            'total_requests': 1,
+            'successful_generations': ideas_generated,
+            'total_tokens_used': tokens_used,
+            tier_field: 1
+        })
+        
+        # Track the unique user, sync_daily_unique_users writes the count
+        _record_daily_user(today.isoformat(), user_id)
             
         logger.info(f"Updated usage stats for user {user_id}")
         
@@ -234,50 +252,140 @@ def update_usage_stats(user_id: int, ideas_generated: int, tokens_used: int = 0,
         logger.error(f"Failed to update usage stats: {str(e)}")
 
 
-@shared_task
+def _upsert_usage_stats(date, increments: Dict[str, int]):
+    """
+    Add to the day's usage counters with a single INSERT ... ON CONFLICT
+    statement, so concurrent workers never race to create the day's row
+    """
+    meta = IdeaUsageStats._meta
+    quote_name = connection.ops.quote_name
+    now = timezone.now()
+    
+    values = {
+        'id': uuid.uuid4(),
+        'created_at': now,
+        'updated_at': now,
+        'date': date,
+        'total_requests': 0,
+        'successful_generations': 0,
+        'failed_generations': 0,
+        'total_users': 0,
+        'free_tier_requests': 0,
+        'premium_requests': 0,
+        'average_rating': Decimal('0.00'),
+        'total_tokens_used': 0,
+        **increments
+    }
+    columns = [quote_name(meta.get_field(name).column) for name in values]
+    params = [meta.get_field(name).get_db_prep_save(value, connection) for name, value in values.items()]
+    
+    table = quote_name(meta.db_table)
+    updates = [
+        f"{column} = {table}.{column} + excluded.{column}"
+        for column in (quote_name(meta.get_field(name).column) for name in increments)
+    ]
+    updates.append(f"{quote_name('updated_at')} = excluded.{quote_name('updated_at')}")
+    
+    # ON CONFLICT upserts are supported by both PostgreSQL and SQLite
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(params))}) "
+            f"ON CONFLICT ({quote_name('date')}) DO UPDATE SET {', '.join(updates)}",
+            params
+        )
+
+
+def _is_premium_user(user_id: int) -> bool:
+    """
+    Whether the user has an active premium subscription, cached for five
+    minutes and cleared when the subscription changes
+    """
+    cache_key = f"user_premium_{user_id}"
+    is_premium = cache.get(cache_key)
+    
+    if is_premium is None:
+        try:
+            is_premium = User.objects.select_related('subscription').get(id=user_id).has_active_subscription()
+        except User.DoesNotExist:
+            is_premium = False
+        cache.set(cache_key, is_premium, 300)
+    
+    return is_premium
+
+
+@shared_task(queue='analytics')
 def _update_daily_unique_users(date_str: str, user_id: int):
     """
     Update daily unique users count
     """
     try:
-        date_obj = datetime.fromisoformat(date_str).date()
-        cache_key = f"daily_users_{date_str}"
-        
-        # Use Redis set to track unique users
-        daily_users = cache.get(cache_key, set())
-        if not isinstance(daily_users, set):
-            daily_users = set()
-            
-        daily_users.add(user_id)
-        cache.set(cache_key, daily_users, 86400)  # 24 hours
+        _record_daily_user(date_str, user_id)
         
         # Update database
-        IdeaUsageStats.objects.filter(date=date_obj).update(
-            total_users=len(daily_users)
+        unique_users = get_redis_connection('default').pfcount(f"daily_users_hll_{date_str}")
+        IdeaUsageStats.objects.filter(date=datetime.fromisoformat(date_str).date()).update(
+            total_users=unique_users
         )
         
     except Exception as e:
         logger.error(f"Failed to update daily unique users: {str(e)}")
 
 
-@shared_task
+def _record_daily_user(date_str: str, user_id: int):
+    """
+    Add a user to the day's unique users. A Redis HyperLogLog keeps this
+    fixed size and atomic on the server, whatever the number of users.
+    """
+    hll_key = f"daily_users_hll_{date_str}"
+    pipe = get_redis_connection('default').pipeline()
+    pipe.pfadd(hll_key, str(user_id))
+    pipe.expire(hll_key, 2 * 86400)  # Kept past midnight for the final sync
+    pipe.execute()
+
+
+@shared_task(queue='analytics')
+def sync_daily_unique_users():
+    """
+    Periodic task: write today's and yesterday's unique user counts to the
+    usage stats in one UPDATE
+    """
+    try:
+        today = timezone.now().date()
+        dates = [today, today - timedelta(days=1)]
+        
+        pipe = get_redis_connection('default').pipeline()
+        for date in dates:
+            pipe.pfcount(f"daily_users_hll_{date.isoformat()}")
+        counts = dict(zip(dates, pipe.execute()))
+        
+        # Days nobody was seen have no HyperLogLog and keep their count
+        counts = {date: count for date, count in counts.items() if count}
+        if counts:
+            IdeaUsageStats.objects.filter(date__in=list(counts)).update(total_users=Case(
+                *[When(date=date, then=count) for date, count in counts.items()],
+                output_field=IntegerField()
+            ))
+        
+    except Exception as e:
+        logger.error(f"Failed to sync daily unique users: {str(e)}")
+
+
+@shared_task(queue='analytics')
 def update_template_usage_stats(request_id: int):
     """
     Update template usage statistics
     """
     try:
-        # Get all ideas generated for this request and their templates
-        ideas = GeneratedIdea.objects.filter(
+        # Templates used by the ideas generated for this request
+        template_ids = GeneratedIdea.objects.filter(
             request_id=request_id
-        ).exclude(template_used__isnull=True)
+        ).exclude(template_used__isnull=True).values('template_used_id')
         
-        template_ids = ideas.values_list('template_used_id', flat=True).distinct()
+        # Count each template once per request, in a single UPDATE
+        IdeaTemplate.objects.filter(id__in=template_ids).update(
+            usage_count=F('usage_count') + 1
+        )
         
-        for template_id in template_ids:
-            IdeaTemplate.objects.filter(id=template_id).update(
-                usage_count=F('usage_count') + 1
-            )
-            
         logger.info(f"Updated template usage stats for request {request_id}")
         
     except Exception as e:
@@ -290,22 +398,22 @@ def cache_user_recent_ideas(user_id: int):
     Cache user's recent ideas for quick access
     """
     try:
+        # Plain rows of the cached fields, no model instances or request join
         recent_ideas = GeneratedIdea.objects.filter(
             request__user_id=user_id
-        ).select_related('request').order_by('-created_at')[:10]
+        ).order_by('-created_at').values(
+            'id', 'title', 'description', 'created_at', 'like_count', 'view_count'
+        )[:10]
         
         cache_key = f"user_recent_ideas_{user_id}"
-        cache_data = []
-        
-        for idea in recent_ideas:
-            cache_data.append({
-                'id': idea.id,
-                'title': idea.title,
-                'description': idea.description[:200],
-                'created_at': idea.created_at.isoformat(),
-                'like_count': idea.like_count,
-                'view_count': idea.view_count
-            })
+        cache_data = [
+            {
+                **idea,
+                'description': idea['description'][:200],
+                'created_at': idea['created_at'].isoformat()
+            }
+            for idea in recent_ideas
+        ]
         
         cache.set(cache_key, cache_data, 3600)  # 1 hour
         logger.info(f"Cached recent ideas for user {user_id}")
@@ -314,24 +422,43 @@ def cache_user_recent_ideas(user_id: int):
         logger.error(f"Failed to cache user recent ideas: {str(e)}")
 
 
+@shared_task(queue='analytics')
+def refresh_user_taste_profile(user_id: int):
+    """
+    Rebuild the preferred categories used for the user's recommendations
+    """
+    try:
+        IdeaRecommendationService.build_taste_profile(user_id)
+        logger.info(f"Refreshed taste profile for user {user_id}")
+        
+    except Exception as e:
+        logger.error(f"Failed to refresh taste profile: {str(e)}")
+
+
 # ==============================================================================
 # ANALYTICS TASKS
 # ==============================================================================
 
-@shared_task
+@shared_task(queue='analytics')
 def analyze_content_quality(request_id: int):
     """
     Analyze the quality of generated content
     """
     try:
-        ideas = GeneratedIdea.objects.filter(request_id=request_id)
+        # Plain rows of the columns the quality metrics look at
+        rows = GeneratedIdea.objects.filter(request_id=request_id).values_list(
+            'id', 'description', 'detailed_plan', 'location_suggestions',
+            'preparation_tips', 'alternatives', 'view_count', 'like_count'
+        )
         
-        for idea in ideas:
-            # Simple quality metrics
-            quality_score = _calculate_content_quality_score(idea)
-            
-            idea.content_quality_score = quality_score
-            idea.save(update_fields=['content_quality_score'])
+        # Simple quality metrics, bulk_update only needs the pk and the score
+        ideas = [
+            GeneratedIdea(id=idea_id, content_quality_score=_calculate_content_quality_score(*metrics))
+            for idea_id, *metrics in rows
+        ]
+        
+        with transaction.atomic():
+            GeneratedIdea.objects.bulk_update(ideas, ['content_quality_score'], batch_size=500)
             
         logger.info(f"Analyzed content quality for request {request_id}")
         
@@ -339,43 +466,152 @@ def analyze_content_quality(request_id: int):
         logger.error(f"Failed to analyze content quality: {str(e)}")
 
 
-@shared_task
+@shared_task(queue='analytics')
 def log_interaction_async(user_id: int, idea_id: int, interaction_type: str, metadata: Dict = None):
     """
     Log user interactions with ideas for analytics
     """
     try:
-        # This could be expanded to log to a separate analytics database
-        # For now, we'll update the idea's engagement metrics
+        # Engagement counters and analytics are applied in batches by drain_interactions
+        queue_interaction(user_id, idea_id, interaction_type, metadata)
+        logger.debug(f"Queued {interaction_type} interaction for idea {idea_id}")
         
-        if interaction_type == 'view':
-            GeneratedIdea.objects.filter(id=idea_id).update(
-                view_count=F('view_count') + 1
-            )
-        elif interaction_type == 'like':
-            GeneratedIdea.objects.filter(id=idea_id).update(
-                like_count=F('like_count') + 1
-            )
-        elif interaction_type == 'share':
-            GeneratedIdea.objects.filter(id=idea_id).update(
-                share_count=F('share_count') + 1
-            )
-        elif interaction_type == 'pdf_download':
-            GeneratedIdea.objects.filter(id=idea_id).update(
-                pdf_download_count=F('pdf_download_count') + 1
+    except Exception as e:
+        logger.error(f"Failed to log interaction: {str(e)}")
+
+
+@shared_task(queue='analytics')
+def refresh_popular_templates():
+    """
+    Periodic task: recount the most used templates for global stats
+    """
+    try:
+        templates = IdeaAnalyticsService.refresh_popular_templates()
+        logger.info(f"Refreshed popular templates ({len(templates)} templates)")
+        
+    except Exception as e:
+        logger.error(f"Failed to refresh popular templates: {str(e)}")
+
+
+@shared_task(queue='analytics')
+def drain_interactions(batch_size: int = 1000) -> int:
+    """
+    Apply interactions queued by log_idea_interaction in batches, with one
+    counter UPDATE per idea. Entries are acknowledged only after their batch
+    has been committed, so a crashed run is picked up again by the next one.
+    Each run stops after INTERACTION_DRAIN_MAX_SECONDS, well inside its lock.
+    """
+    redis = get_redis_connection('default')
+    lock = redis.lock(f"{INTERACTION_STREAM_KEY}:drain", timeout=INTERACTION_DRAIN_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        return 0
+    
+    deadline = time.monotonic() + INTERACTION_DRAIN_MAX_SECONDS
+    
+    try:
+        try:
+            redis.xgroup_create(INTERACTION_STREAM_KEY, INTERACTION_CONSUMER_GROUP, id='0', mkstream=True)
+        except ResponseError:
+            # Group already exists
+            pass
+        
+        processed = 0
+        # Re-read entries left unacknowledged by a previous run before new ones
+        stream_id = '0'
+        while time.monotonic() < deadline:
+            response = redis.xreadgroup(
+                INTERACTION_CONSUMER_GROUP, 'drain',
+                {INTERACTION_STREAM_KEY: stream_id},
+                count=batch_size
             )
+            entries = response[0][1] if response else []
+            if not entries:
+                if stream_id == '0':
+                    stream_id = '>'
+                    continue
+                break
+            
+            try:
+                _apply_interactions([fields for _, fields in entries])
+            except Exception as e:
+                logger.error(f"Failed to apply interaction batch, retrying entry by entry: {str(e)}")
+                _apply_interactions_one_by_one(redis, entries)
+            redis.xack(INTERACTION_STREAM_KEY, INTERACTION_CONSUMER_GROUP, *[entry_id for entry_id, _ in entries])
+            processed += len(entries)
+        
+        if processed:
+            logger.debug(f"Applied {processed} idea interactions")
+        return processed
+        
+    finally:
+        try:
+            lock.release()
+        except LockNotOwnedError:
+            logger.warning("Interaction drain lock expired before the run finished")
+
+
+def _apply_interactions_one_by_one(redis, entries: List[tuple]):
+    """
+    Apply a failed batch entry by entry, moving the entries that still fail
+    to the dead-letter stream so they are acknowledged and never block the
+    stream again
+    """
+    for entry_id, fields in entries:
+        try:
+            _apply_interactions([fields])
+        except Exception as e:
+            logger.error(f"Moving interaction {entry_id.decode()} to the dead-letter stream: {str(e)}")
+            redis.xadd(INTERACTION_DEAD_LETTER_KEY, fields, maxlen=INTERACTION_STREAM_MAXLEN, approximate=True)
+
+
+def _apply_interactions(entries: List[Dict[bytes, bytes]]):
+    """
+    Add up a batch of stream entries into one UPDATE per counter field
+    """
+    counters = defaultdict(Counter)
+    analytics_enabled = getattr(settings, 'ANALYTICS_ENABLED', False)
+    analytics_events = []
+    
+    for fields in entries:
+        idea_id = fields[b'idea_id'].decode()
+        interaction_type = fields[b'interaction_type'].decode()
+        
+        counter_field = INTERACTION_COUNTER_FIELDS.get(interaction_type)
+        if counter_field:
+            counters[counter_field][idea_id] += 1
         
         # Log to analytics service if available
-        if hasattr(settings, 'ANALYTICS_ENABLED') and settings.ANALYTICS_ENABLED:
-            _send_to_analytics.delay(user_id, idea_id, interaction_type, metadata)
+        if analytics_enabled:
+            analytics_events.append((
+                fields[b'user_id'].decode(), idea_id, interaction_type, json.loads(fields[b'metadata'])
+            ))
+    
+    with transaction.atomic():
+        for field, counts in counters.items():
+            # Ideas that gained the same count share one WHEN branch
+            ideas_by_count = defaultdict(list)
+            for idea_id, count in counts.items():
+                ideas_by_count[count].append(idea_id)
             
-        logger.debug(f"Logged {interaction_type} interaction for idea {idea_id}")
-        
-    except Exception as e:
-        logger.error(f"Failed to log interaction: {str(e)}")
+            GeneratedIdea.objects.filter(id__in=list(counts)).update(**{
+                field: Case(
+                    *[When(id__in=idea_ids, then=F(field) + count)
+                      for count, idea_ids in ideas_by_count.items()],
+                    default=F(field),
+                    output_field=IntegerField()
+                )
+            })
+    
+    # Only sent once the batch has been applied, and never raised from, so a
+    # failed publish cannot make the caller apply the batch a second time
+    for event in analytics_events:
+        try:
+            _send_to_analytics.delay(*event)
+        except Exception as e:
+            logger.error(f"Failed to queue interaction analytics: {str(e)}")
 
 
-@shared_task
+@shared_task(queue='analytics')
 def _send_to_analytics(user_id: int, idea_id: int, interaction_type: str, metadata: Dict):
     """
     Send interaction data to external analytics service
@@ -404,7 +640,7 @@ def _send_to_analytics(user_id: int, idea_id: int, interaction_type: str, metada
 # SCHEDULED TASKS
 # ==============================================================================
 
-@shared_task
+@shared_task(queue='analytics')
 def generate_daily_analytics_report():
     """
     Generate daily analytics report
@@ -445,7 +681,7 @@ def generate_daily_analytics_report():
         logger.error(f"Failed to generate daily analytics report: {str(e)}")
 
 
-@shared_task
+@shared_task(queue='analytics')
 def cleanup_old_data():
     """
     Clean up old data to maintain database performance
@@ -453,20 +689,32 @@ def cleanup_old_data():
     try:
         cutoff_date = timezone.now() - timedelta(days=90)
         
-        # Clean up old failed requests
+        # Clean up old failed requests. These go through delete() so that
+        # any partially generated ideas cascade with them.
         old_failed_requests = IdeaRequest.objects.filter(
             status='failed',
             created_at__lt=cutoff_date
         )
+        deleted_count = 0
+        while True:
+            chunk = list(old_failed_requests.values_list('pk', flat=True)[:CLEANUP_CHUNK_SIZE])
+            if not chunk:
+                break
+            # One global stats bump for the chunk rather than one per deleted row
+            with IdeaCacheService.global_stats_bulk_change():
+                _, deleted_per_model = IdeaRequest.objects.filter(pk__in=chunk).delete()
+            deleted_count += deleted_per_model.get(IdeaRequest._meta.label, 0)
         
-        deleted_count = old_failed_requests.count()
-        old_failed_requests.delete()
-        
-        # Clean up old usage stats (keep only last year)
+        # Clean up old usage stats (keep only last year). Nothing references
+        # them, so plain DELETE statements skip collecting rows and signals.
         old_stats_cutoff = timezone.now().date() - timedelta(days=365)
         old_stats = IdeaUsageStats.objects.filter(date__lt=old_stats_cutoff)
-        old_stats_count = old_stats.count()
-        old_stats.delete()
+        old_stats_count = 0
+        while True:
+            chunk = list(old_stats.values_list('pk', flat=True)[:CLEANUP_CHUNK_SIZE])
+            if not chunk:
+                break
+            old_stats_count += IdeaUsageStats.objects.filter(pk__in=chunk)._raw_delete(old_stats.db)
         
         logger.info(f"Cleaned up {deleted_count} old requests and {old_stats_count} old stats")
         
@@ -484,12 +732,14 @@ def schedule_feedback_reminder(user_id: int, request_id: int):
     Schedule a reminder for user to provide feedback
     """
     try:
-        # Schedule reminder for 24 hours later
+        # Schedule reminder for 24 hours later. Kept in Redis rather than as a
+        # Celery eta task, so it survives worker restarts and does not sit in
+        # a worker's prefetch buffer for a day.
         reminder_time = timezone.now() + timedelta(hours=24)
         
-        send_feedback_reminder.apply_async(
-            args=[user_id, request_id],
-            eta=reminder_time
+        get_redis_connection('default').zadd(
+            FEEDBACK_REMINDERS_KEY,
+            {f"{user_id}:{request_id}": reminder_time.timestamp()}
         )
         
         logger.info(f"Scheduled feedback reminder for user {user_id}")
@@ -498,7 +748,40 @@ def schedule_feedback_reminder(user_id: int, request_id: int):
         logger.error(f"Failed to schedule feedback reminder: {str(e)}")
 
 
-@shared_task
+@shared_task(queue='notifications')
+def sweep_feedback_reminders(batch_size: int = 500):
+    """
+    Periodic task: send the feedback reminders that have come due
+    """
+    try:
+        redis = get_redis_connection('default')
+        due = redis.zrangebyscore(
+            FEEDBACK_REMINDERS_KEY, 0, time.time(), start=0, num=batch_size, withscores=True
+        )
+        
+        dispatched = 0
+        for member, due_at in due:
+            # Only the sweep that removes a reminder sends it
+            if not redis.zrem(FEEDBACK_REMINDERS_KEY, member):
+                continue
+            user_id, request_id = member.decode().split(':')
+            try:
+                send_feedback_reminder.delay(user_id, request_id)
+            except Exception as e:
+                # Put the reminder back so the next sweep retries it
+                redis.zadd(FEEDBACK_REMINDERS_KEY, {member: due_at})
+                logger.error(f"Failed to dispatch feedback reminder {member.decode()}: {str(e)}")
+                continue
+            dispatched += 1
+        
+        if dispatched:
+            logger.info(f"Dispatched {dispatched} due feedback reminders")
+        
+    except Exception as e:
+        logger.error(f"Failed to sweep feedback reminders: {str(e)}")
+
+
+@shared_task(queue='notifications')
 def send_feedback_reminder(user_id: int, request_id: int):
     """
     Send feedback reminder email to user
@@ -518,18 +801,14 @@ def send_feedback_reminder(user_id: int, request_id: int):
             return
         
         # Send reminder email
-        subject = "How were your date ideas? We'd love your feedback!"
-        message = render_to_string('emails/feedback_reminder.html', {
-            'user': user,
-            'request': request_obj
-        })
-        
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            html_message=message
+        _send_html_email(
+            subject="How were your date ideas? We'd love your feedback!",
+            template_name='emails/feedback_reminder.html',
+            context={
+                'user': user,
+                'request': request_obj
+            },
+            recipient_list=[user.email]
         )
         
         logger.info(f"Sent feedback reminder to user {user_id}")
@@ -540,7 +819,7 @@ def send_feedback_reminder(user_id: int, request_id: int):
         logger.error(f"Failed to send feedback reminder: {str(e)}")
 
 
-@shared_task
+@shared_task(queue='notifications')
 def _notify_generation_failed(request_id: int, error_message: str):
     """
     Notify user that idea generation failed
@@ -548,19 +827,15 @@ def _notify_generation_failed(request_id: int, error_message: str):
     try:
         request_obj = IdeaRequest.objects.select_related('user').get(id=request_id)
         
-        subject = "We're having trouble generating your date ideas"
-        message = render_to_string('emails/generation_failed.html', {
-            'user': request_obj.user,
-            'request': request_obj,
-            'error_message': error_message
-        })
-        
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[request_obj.user.email],
-            html_message=message
+        _send_html_email(
+            subject="We're having trouble generating your date ideas",
+            template_name='emails/generation_failed.html',
+            context={
+                'user': request_obj.user,
+                'request': request_obj,
+                'error_message': error_message
+            },
+            recipient_list=[request_obj.user.email]
         )
         
         logger.info(f"Sent generation failed notification to user {request_obj.user.id}")
@@ -569,25 +844,21 @@ def _notify_generation_failed(request_id: int, error_message: str):
         logger.error(f"Failed to send generation failed notification: {str(e)}")
 
 
-@shared_task
+@shared_task(queue='notifications')
 def _send_analytics_report(report_data: Dict):
     """
     Send analytics report to admin team
     """
     try:
-        subject = f"LoveCraft Daily Analytics Report - {report_data['date']}"
-        message = render_to_string('emails/analytics_report.html', {
-            'report': report_data
-        })
-        
         admin_emails = getattr(settings, 'ADMIN_EMAILS', [])
         if admin_emails:
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=admin_emails,
-                html_message=message
+            _send_html_email(
+                subject=f"LoveCraft Daily Analytics Report - {report_data['date']}",
+                template_name='emails/analytics_report.html',
+                context={
+                    'report': report_data
+                },
+                recipient_list=admin_emails
             )
         
         logger.info("Sent daily analytics report to admin team")
@@ -596,10 +867,149 @@ def _send_analytics_report(report_data: Dict):
         logger.error(f"Failed to send analytics report: {str(e)}")
 
 
+# SMTP connection kept open for the lifetime of the worker process
+_mail_connection = None
+
+
+@lru_cache(maxsize=None)
+def _email_template(template_name: str):
+    """
+    Load and compile an email template once per process
+    """
+    return get_template(template_name)
+
+
+def _send_html_email(subject: str, template_name: str, context: Dict, recipient_list: List[str]):
+    """
+    Render an HTML email and send it over the worker's shared SMTP connection,
+    so notifications do not pay for a new SMTP handshake each
+    """
+    global _mail_connection
+    
+    message = _email_template(template_name).render(context)
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=recipient_list
+    )
+    email.attach_alternative(message, 'text/html')
+    
+    for attempt in range(2):
+        if _mail_connection is None:
+            _mail_connection = get_connection()
+            _mail_connection.open()
+        try:
+            _mail_connection.send_messages([email])
+            return
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection, reconnect once
+            _mail_connection.close()
+            _mail_connection = None
+            if attempt:
+                raise
+
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
+def _run_idea_generation(idea_request: IdeaRequest, model_config: Optional[Dict]) -> Dict[str, Any]:
+    """
+    Generate ideas for an already loaded request
+    """
+    request_id = idea_request.id
+    
+    # Mark as processing
+    idea_request.mark_as_processing()
+    
+    logger.info(f"Starting idea generation for request {request_id}")
+
+    # Initialize services
+    generation_service = IdeaGenerationService()
+    ai_client = AIClient()
+    
+    # Check if AI service is available
+    if not ai_client.is_service_available():
+        raise ServiceUnavailableError("AI service is currently unavailable")
+
+    # Check AI model configuration
+    if not model_config:
+        raise ValidationError(f"AI model {idea_request.ai_model} not configured")
+
+    # Prepare generation request
+    generation_request = _prepare_generation_request(idea_request)
+    
+    # Use chord pattern for parallel generation of many ideas
+    ideas_count = _get_ideas_count_for_user(idea_request.user)
+    
+    if ideas_count > getattr(settings, 'MAX_THREADED_IDEAS', 8):
+        # Generate multiple ideas in parallel, assemble_ideas completes the request
+        _generate_multiple_ideas_parallel(
+            generation_request,
+            ideas_count,
+            model_config
+        )
+        logger.info(f"Dispatched parallel generation of {ideas_count} ideas for request {request_id}")
+        
+        return {
+            'success': True,
+            'request_id': request_id,
+            'ideas_requested': ideas_count
+        }
+    
+    if ideas_count > 1:
+        # Generate a few ideas on threads in this worker, the AI calls are I/O bound
+        result = _generate_multiple_ideas_threaded(
+            generation_request,
+            ideas_count,
+            model_config
+        )
+        if not result['ideas']:
+            raise ValidationError("Failed to generate any ideas")
+    else:
+        # Generate single idea
+        result = _generate_single_idea(
+            generation_request,
+            model_config
+        )
+    
+    with transaction.atomic():
+        saved_ideas = generation_service.create_ideas(idea_request, result['ideas'])
+        _complete_idea_generation(idea_request, len(saved_ideas))
+    
+    return {
+        'success': True,
+        'request_id': request_id,
+        'ideas_generated': len(saved_ideas),
+        'processing_time': idea_request.get_processing_time()
+    }
+
+
+def _complete_idea_generation(idea_request: IdeaRequest, ideas_generated: int):
+    """
+    Mark a request as completed and schedule its post-generation tasks
+    """
+    # Mark request as completed
+    idea_request.mark_as_completed()
+    
+    # Schedule post-generation tasks, none of which has work without ideas.
+    # They run on another queue and read the saved ideas, so they are only
+    # queued once the transaction saving them has committed.
+    if ideas_generated > 0:
+        request_id = idea_request.id
+        user_id = idea_request.user.id
+        transaction.on_commit(lambda: _schedule_post_generation_tasks.delay(
+            request_id=request_id,
+            ideas_generated=ideas_generated,
+            user_id=user_id
+        ))
+    else:
+        logger.info(f"Skipping post-generation tasks for request {idea_request.id} without ideas")
+    
+    logger.info(f"Successfully generated {ideas_generated} ideas for request {idea_request.id}")
+
+
 def _prepare_generation_request(idea_request: IdeaRequest) -> Dict[str, Any]:
     """
     Prepare generation request data from IdeaRequest model
@@ -627,26 +1037,49 @@ def _get_ai_model_config(model_name: str) -> Optional[Dict]:
     """
     Get AI model configuration
     """
+    return _get_ai_model_configs({model_name}).get(model_name)
+
+
+def _get_ai_model_configs(model_names) -> Dict[str, Dict]:
+    """
+    Get active AI model configurations by name, from the per-process cache
+    """
     try:
-        config = AIModelConfiguration.objects.filter(
-            name=model_name,
-            is_active=True
-        ).first()
-        
-        if config:
-            return {
-                'name': config.name,
-                'provider': config.provider,
-                'model_id': config.model_id,
-                'max_tokens': config.max_tokens,
-                'temperature': config.temperature,
-                'cost_per_1k_tokens': float(config.cost_per_1k_tokens)
-            }
-        return None
+        ttl = getattr(settings, 'AI_MODEL_CONFIG_CACHE_TTL', 60)
+        configs = _load_ai_model_configs(
+            frozenset(model_names),
+            IdeaCacheService.get_ai_model_config_revision(),
+            int(time.time() // ttl)
+        )
+        # Copies, so callers cannot change the cached configurations
+        return {name: dict(config) for name, config in configs.items()}
         
     except Exception as e:
         logger.error(f"Failed to get AI model config: {str(e)}")
-        return None
+        return {}
+
+
+@lru_cache(maxsize=32)
+def _load_ai_model_configs(model_names: frozenset, revision: int, ttl_bucket: int) -> Dict[str, Dict]:
+    """
+    Load active AI model configurations with a single query, cached per process.
+    Keyed on the shared revision bumped by the post_save signal, so every
+    worker picks up a change on its next lookup.
+    """
+    return {
+        config.name: {
+            'name': config.name,
+            'provider': config.provider,
+            'model_id': config.model_id,
+            'max_tokens': config.max_tokens,
+            'temperature': config.temperature,
+            'cost_per_1k_tokens': float(config.cost_per_1k_tokens)
+        }
+        for config in AIModelConfiguration.objects.filter(
+            name__in=model_names,
+            is_active=True
+        )
+    }
 
 
 def _get_ideas_count_for_user(user: User) -> int:
@@ -663,20 +1096,46 @@ def _get_ideas_count_for_user(user: User) -> int:
 
 def _generate_single_idea(generation_request: Dict, model_config: Dict) -> Dict[str, Any]:
     """
-    Generate a single idea
+    Run one generation pass. The service loads the model configuration
+    itself; model_config was already checked by the caller.
     """
     generation_service = IdeaGenerationService()
     from .services import IdeaGenerationRequest
     
     request_obj = IdeaGenerationRequest(**generation_request)
-    result = generation_service.generate_ideas(request_obj, model_config)
     
-    return {'ideas': [result] if result else []}
+    return {'ideas': generation_service.generate_ideas(request_obj)}
+
+
+def _generate_multiple_ideas_threaded(generation_request: Dict, count: int, model_config: Dict) -> Dict[str, Any]:
+    """
+    Generate multiple ideas on a thread pool inside this worker, saving a
+    broker round trip per idea and sharing the AI client's HTTP connections
+    """
+    def generate(_):
+        try:
+            return _generate_single_idea(generation_request, model_config)
+        except Exception as e:
+            logger.error(f"Failed to generate single idea: {str(e)}")
+            return {'ideas': []}
+        finally:
+            # Pool threads open their own database connections
+            connections.close_all()
+    
+    executor = ThreadPoolExecutor(max_workers=count)
+    try:
+        results = list(executor.map(generate, range(count), timeout=IDEA_GENERATION_THREAD_TIMEOUT))
+    finally:
+        # A with block would join the threads and wait past the timeout
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return {'ideas': [idea for result in results for idea in result['ideas']]}
 
 
-def _generate_multiple_ideas_parallel(generation_request: Dict, count: int, model_config: Dict) -> Dict[str, Any]:
+def _generate_multiple_ideas_parallel(generation_request: Dict, count: int, model_config: Dict):
     """
-    Generate multiple ideas in parallel using Celery chord
+    Generate multiple ideas in parallel using Celery chord. The results are
+    collected by the assemble_ideas callback, so no worker blocks waiting.
     """
     # Create parallel tasks for each idea
     generation_tasks = [
@@ -684,45 +1143,31 @@ def _generate_multiple_ideas_parallel(generation_request: Dict, count: int, mode
         for _ in range(count)
     ]
     
-    # Execute in parallel and collect results
-    job = group(*generation_tasks)()
-    results = job.get(timeout=300)  # 5 minutes timeout
-    
-    # Process results
-    ideas = []
-    for result in results:
-        if result.get('success') and result.get('idea'):
-            ideas.append(result['idea'])
-    
-    return {'ideas': ideas}
+    request_id = generation_request['request_id']
+    return chord(generation_tasks)(
+        assemble_ideas.s(request_id).on_error(mark_generation_failed.s(request_id=request_id))
+    )
 
 
-def _calculate_content_quality_score(idea: GeneratedIdea) -> float:
+def _calculate_content_quality_score(description: str, detailed_plan: str, location_suggestions: List,
+                                     preparation_tips: str, alternatives: str,
+                                     view_count: int, like_count: int) -> float:
     """
     Calculate content quality score based on various metrics
     """
     try:
-        score = 0.0
-        
-        # Length checks
-        if len(idea.description) > 100:
-            score += 0.2
-        if len(idea.detailed_plan) > 200:
-            score += 0.2
-        
-        # Content diversity
-        if idea.location_suggestions:
-            score += 0.2
-        if idea.preparation_tips:
-            score += 0.1
-        if idea.alternatives:
-            score += 0.1
-        
-        # Engagement metrics
-        if idea.view_count > 0:
-            score += 0.1
-        if idea.like_count > 0:
-            score += 0.1
+        score = (
+            # Length checks
+            0.2 * (len(description) > 100)
+            + 0.2 * (len(detailed_plan) > 200)
+            # Content diversity
+            + 0.2 * bool(location_suggestions)
+            + 0.1 * bool(preparation_tips)
+            + 0.1 * bool(alternatives)
+            # Engagement metrics
+            + 0.1 * (view_count > 0)
+            + 0.1 * (like_count > 0)
+        )
         
         return min(score, 1.0)  # Cap at 1.0
         
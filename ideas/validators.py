@@ -2,8 +2,12 @@
 import re
 import json
 import logging
+import string
+import threading
 from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Optional, Any, Union
+from functools import lru_cache, wraps
+from ipaddress import IPv4Address, AddressValueError
+from typing import AbstractSet, Dict, List, Optional, Any, Union
 from urllib.parse import urlparse
 
 from django.core.exceptions import ValidationError
@@ -15,6 +19,27 @@ from django.utils.text import slugify
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson, fallback to the stdlib json parser if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import hyperscan, fallback to the combined re patterns if not available
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Try to import pyahocorasick, fallback to plain substring checks if not available
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Constants for validation
 MAX_PROMPT_LENGTH = 10000
 MIN_PROMPT_LENGTH = 10
@@ -27,6 +52,10 @@ MAX_COMMENT_LENGTH = 1000
 MIN_RATING = 1
 MAX_RATING = 5
 
+# Memoization of pure text checks; longer inputs are not cached
+VALIDATION_CACHE_SIZE = 4096
+VALIDATION_CACHE_MAX_TEXT_LENGTH = 1000
+
 # Profanity and spam patterns (basic implementation)
 PROFANITY_PATTERNS = [
     r'\b(spam|scam|fake|bot|test)\b',
@@ -36,19 +65,131 @@ PROFANITY_PATTERNS = [
 
 SPAM_PATTERNS = [
     r'(https?://\S+){3,}',  # Multiple URLs
-    r'(.)\1{10,}',  # Repeated characters
+    r'(?P<repeated>.)(?P=repeated){10,}',  # Repeated characters
     r'\b(buy now|click here|free money|make money)\b',
-    r'[A-Z]{5,}\s[A-Z]{5,}',  # All caps words
 ]
 
-# Suspicious IP patterns
-SUSPICIOUS_IP_PATTERNS = [
-    r'^10\.',  # Private network
-    r'^192\.168\.',  # Private network
-    r'^172\.(1[6-9]|2[0-9]|3[01])\.',  # Private network
-    r'^127\.',  # Localhost
+# Checked case-sensitively against the original text
+ALL_CAPS_PATTERN = r'[A-Z]{5,}\s[A-Z]{5,}'  # All caps words
+
+# Prompt injection patterns
+INJECTION_PATTERNS = [
+    r'ignore\s+(previous|above|all)\s+instructions',
+    r'system\s*:\s*',
+    r'assistant\s*:\s*',
+    r'human\s*:\s*',
+    r'ai\s*:\s*',
+    r'pretend\s+to\s+be',
+    r'act\s+as\s+if',
+    r'forget\s+everything',
+    r'new\s+instructions',
+    r'override\s+instructions',
+]
+
+# System command patterns
+COMMAND_PATTERNS = [
+    r'\$\s*\w+',  # Shell variables
+    r';\s*rm\s+',  # Dangerous commands
+    r';\s*del\s+',
+    r';\s*sudo\s+',
+    r'exec\s*\(',
+    r'eval\s*\(',
+    r'__import__',
+    r'subprocess',
+    r'os\.system',
+]
+
+
+
+def _combine_patterns(patterns: List[str], flags: int = 0):
+    """Compile a pattern list into one alternation so the text is scanned once"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+class _HyperscanMatcher:
+    """Block-mode Hyperscan database with the re-style search() the checks use"""
+    
+    def __init__(self, patterns: List[str]):
+        self._db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        self._db.compile(
+            expressions=[p.encode('utf-8') for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[
+                hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 |
+                hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+            ] * len(patterns)
+        )
+        # Scratch space cannot be shared between concurrent scans
+        self._local = threading.local()
+    
+    def search(self, text: str) -> Optional[bool]:
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._db)
+        
+        hits = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.append(pattern_id)
+            return True  # Stop at the first match
+        
+        try:
+            self._db.scan(text.encode('utf-8'), match_event_handler=on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            pass
+        
+        return True if hits else None
+
+
+def _compile_scanner(patterns: List[str]):
+    """Case-insensitive multi-pattern scanner, Hyperscan when the patterns allow it"""
+    if HYPERSCAN_AVAILABLE:
+        try:
+            return _HyperscanMatcher(patterns)
+        except hyperscan.error as e:
+            # e.g. backreferences are outside Hyperscan's supported syntax
+            logger.info(f"Falling back to re for pattern group: {str(e)}")
+    return _combine_patterns(patterns, re.IGNORECASE)
+
+
+# Compiled once at import; the validators run on every request.
+# Patterns in a combined group must not use numbered backreferences.
+# They match case-insensitively; str.lower() is not a substitute, since
+# IGNORECASE also matches characters such as the long s (ſ) to "s".
+_PROFANITY_RE = _compile_scanner(PROFANITY_PATTERNS)
+_SPAM_RE = _compile_scanner(SPAM_PATTERNS)
+_INJECTION_RE = _compile_scanner(INJECTION_PATTERNS)
+_COMMAND_RE = _compile_scanner(COMMAND_PATTERNS)
+_ALL_CAPS_RE = re.compile(ALL_CAPS_PATTERN)
+
+# Translation tables deleting characters in one C-level pass: what is left
+# of a city name after removing its allowed ASCII characters must be
+# whitespace, and search queries drop the HTML/quote characters
+_CITY_NAME_TABLE = str.maketrans('', '', string.ascii_letters + "-.'")
+_SEARCH_UNSAFE_CHARS_TABLE = str.maketrans('', '', '<>"\'')
+
+# Keywords that mark interests as describing actual activities
+VALID_INTEREST_KEYWORDS = [
+    'music', 'movie', 'book', 'sport', 'food', 'travel', 'art', 'dance',
+    'cook', 'read', 'watch', 'play', 'listen', 'walk', 'run', 'swim',
+    'hiking', 'gaming', 'photography', 'painting', 'writing', 'learning'
 ]
 
+
+def _build_keyword_automaton(keywords: List[str]):
+    """Aho-Corasick automaton matching all keywords in a single pass"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_INTEREST_KEYWORD_AUTOMATON = (
+    _build_keyword_automaton(VALID_INTEREST_KEYWORDS) if AHOCORASICK_AVAILABLE else None
+)
+_INTEREST_KEYWORD_RE = _combine_patterns([re.escape(keyword) for keyword in VALID_INTEREST_KEYWORDS])
+
 # Valid location types and other choices (should match model choices)
 VALID_BUDGET_CHOICES = ['low', 'moderate', 'high', 'luxury']
 VALID_LOCATION_TYPES = ['indoor', 'outdoor', 'home', 'restaurant', 'activity', 'travel', 'any']
@@ -57,6 +198,34 @@ VALID_PERSONALITY_TYPES = ['adventurous', 'romantic', 'intellectual', 'active',
 VALID_FEEDBACK_TYPES = ['rating', 'comment', 'report', 'suggestion']
 VALID_REPORT_REASONS = ['inappropriate', 'spam', 'offensive', 'copyright', 'other']
 
+# Sets for O(1) membership checks, with the error message for each field built once
+_VALID_BUDGET = frozenset(VALID_BUDGET_CHOICES)
+_INVALID_BUDGET_MSG = f"Invalid budget. Valid choices: {', '.join(VALID_BUDGET_CHOICES)}"
+_VALID_LOCATION_TYPES = frozenset(VALID_LOCATION_TYPES)
+_INVALID_LOCATION_TYPE_MSG = f"Invalid location_type. Valid choices: {', '.join(VALID_LOCATION_TYPES)}"
+_VALID_DURATION = frozenset(VALID_DURATION_CHOICES)
+_INVALID_DURATION_MSG = f"Invalid duration. Valid choices: {', '.join(VALID_DURATION_CHOICES)}"
+_VALID_PERSONALITY_TYPES = frozenset(VALID_PERSONALITY_TYPES)
+_INVALID_PERSONALITY_TYPE_MSG = f"Invalid personality_type. Valid choices: {', '.join(VALID_PERSONALITY_TYPES)}"
+_VALID_FEEDBACK_TYPES = frozenset(VALID_FEEDBACK_TYPES)
+_INVALID_FEEDBACK_TYPE_MSG = f"Invalid feedback_type. Valid choices: {', '.join(VALID_FEEDBACK_TYPES)}"
+_VALID_REPORT_REASONS = frozenset(VALID_REPORT_REASONS)
+_INVALID_REPORT_REASON_MSG = f"Invalid report_reason. Valid choices: {', '.join(VALID_REPORT_REASONS)}"
+
+
+def _memoize_short_text(func):
+    """lru_cache for single-argument text validators, bypassed for long or non-str input"""
+    cached = lru_cache(maxsize=VALIDATION_CACHE_SIZE)(func)
+    
+    @wraps(func)
+    def wrapper(text):
+        if isinstance(text, str) and len(text) <= VALIDATION_CACHE_MAX_TEXT_LENGTH:
+            return cached(text)
+        return func(text)
+    
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
 
 class ValidationError(Exception):
     """Custom validation error for ideas app"""
@@ -92,19 +261,20 @@ def validate_text_content(text: str, field_name: str = "text",
     # Strip whitespace
     text = text.strip()
     
-    # Check length
-    if len(text) < min_length:
+    # Check length before the more expensive HTML and pattern scans
+    length = len(text)
+    if length < min_length:
         raise ValidationError(
             f"{field_name} must be at least {min_length} characters long"
         )
     
-    if len(text) > max_length:
+    if length > max_length:
         raise ValidationError(
             f"{field_name} cannot exceed {max_length} characters"
         )
     
-    # Remove HTML tags if not allowed
-    if not allow_html:
+    # Remove HTML tags if not allowed; text without '<' cannot contain any
+    if not allow_html and '<' in text:
         text = strip_tags(text)
     
     # Check for profanity
@@ -135,85 +305,11 @@ def validate_idea_request_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     validated_data = {}
     
-    # Validate title (optional)
-    if 'title' in data and data['title']:
-        validated_data['title'] = validate_text_content(
-            data['title'], 
-            field_name="title",
-            min_length=5,
-            max_length=200,
-            check_profanity=True
-        )
-    
-    # Validate occasion (optional)
-    if 'occasion' in data and data['occasion']:
-        validated_data['occasion'] = validate_text_content(
-            data['occasion'],
-            field_name="occasion",
-            min_length=3,
-            max_length=100
-        )
-    
-    # Validate interests
-    if 'partner_interests' in data and data['partner_interests']:
-        validated_data['partner_interests'] = validate_interests(
-            data['partner_interests'], 
-            "partner_interests"
-        )
-    
-    if 'user_interests' in data and data['user_interests']:
-        validated_data['user_interests'] = validate_interests(
-            data['user_interests'], 
-            "user_interests"
-        )
-    
-    # Validate personality type
-    if 'personality_type' in data and data['personality_type']:
-        validated_data['personality_type'] = validate_choice(
-            data['personality_type'],
-            VALID_PERSONALITY_TYPES,
-            "personality_type"
-        )
-    
-    # Validate budget
-    if 'budget' in data and data['budget']:
-        validated_data['budget'] = validate_choice(
-            data['budget'],
-            VALID_BUDGET_CHOICES,
-            "budget"
-        )
-    
-    # Validate location
-    if 'location_type' in data and data['location_type']:
-        validated_data['location_type'] = validate_choice(
-            data['location_type'],
-            VALID_LOCATION_TYPES,
-            "location_type"
-        )
-    
-    if 'location_city' in data and data['location_city']:
-        validated_data['location_city'] = validate_city_name(data['location_city'])
-    
-    # Validate duration
-    if 'duration' in data and data['duration']:
-        validated_data['duration'] = validate_choice(
-            data['duration'],
-            VALID_DURATION_CHOICES,
-            "duration"
-        )
-    
-    # Validate special requirements
-    if 'special_requirements' in data and data['special_requirements']:
-        validated_data['special_requirements'] = validate_text_content(
-            data['special_requirements'],
-            field_name="special_requirements",
-            min_length=5,
-            max_length=MAX_REQUIREMENTS_LENGTH
-        )
-    
-    # Validate custom prompt
-    if 'custom_prompt' in data and data['custom_prompt']:
-        validated_data['custom_prompt'] = validate_ai_prompt(data['custom_prompt'])
+    # Optional text and choice fields, validated only when non-empty
+    for key, validator, kwargs in _FIELD_VALIDATORS:
+        value = data.get(key)
+        if value:
+            validated_data[key] = validator(value, **kwargs)
     
     # Validate AI parameters
     if 'temperature' in data:
@@ -222,12 +318,8 @@ def validate_idea_request_data(data: Dict[str, Any]) -> Dict[str, Any]:
     if 'max_tokens' in data:
         validated_data['max_tokens'] = validate_max_tokens(data['max_tokens'])
     
-    if 'ai_model' in data and data['ai_model']:
-        validated_data['ai_model'] = validate_ai_model(data['ai_model'])
-    
     # Ensure at least some meaningful input is provided
-    required_fields = ['partner_interests', 'user_interests', 'custom_prompt', 'occasion']
-    if not any(validated_data.get(field) for field in required_fields):
+    if not validated_data.keys() & _REQUIRED_IDEA_REQUEST_FIELDS:
         raise ValidationError(
             "Please provide at least one of: partner interests, your interests, "
             "occasion, or custom prompt"
@@ -258,9 +350,14 @@ def validate_interests(interests: str, field_name: str) -> str:
         check_profanity=True
     )
     
-    # Check for meaningful content (not just repeated words)
-    words = interests.lower().split()
-    if len(set(words)) < 3:
+    # Check for meaningful content (not just repeated words), stopping at
+    # the third distinct word
+    seen_words = set()
+    for word in interests.lower().split():
+        seen_words.add(word)
+        if len(seen_words) >= 3:
+            break
+    else:
         raise ValidationError(
             f"{field_name} should contain at least 3 different words"
         )
@@ -384,6 +481,7 @@ def validate_ai_model(model: str) -> str:
     return model
 
 
+@_memoize_short_text
 def validate_city_name(city: str) -> str:
     """
     Validate city name
@@ -406,19 +504,22 @@ def validate_city_name(city: str) -> str:
     )
     
     # Check for valid city name pattern
-    if not re.match(r'^[a-zA-Z\s\-\.\']+$', city):
+    invalid_chars = city.translate(_CITY_NAME_TABLE)
+    if invalid_chars and not invalid_chars.isspace():
         raise ValidationError("City name contains invalid characters")
     
     return city.title()  # Capitalize properly
 
 
-def validate_choice(value: str, valid_choices: List[str], field_name: str) -> str:
+def validate_choice(value: str, valid_choices: AbstractSet[str], invalid_message: str,
+                    field_name: str) -> str:
     """
     Validate choice field against valid options
     
     Args:
         value: Value to validate
-        valid_choices: List of valid choices
+        valid_choices: Set of valid choices
+        invalid_message: Error message raised for a value not in valid_choices
         field_name: Name of the field for error messages
         
     Returns:
@@ -433,9 +534,7 @@ def validate_choice(value: str, valid_choices: List[str], field_name: str) -> st
     value = value.strip().lower()
     
     if value not in valid_choices:
-        raise ValidationError(
-            f"Invalid {field_name}. Valid choices: {', '.join(valid_choices)}"
-        )
+        raise ValidationError(invalid_message)
     
     return value
 
@@ -485,7 +584,8 @@ def validate_feedback_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     feedback_type = validate_choice(
         data['feedback_type'],
-        VALID_FEEDBACK_TYPES,
+        _VALID_FEEDBACK_TYPES,
+        _INVALID_FEEDBACK_TYPE_MSG,
         "feedback_type"
     )
     validated_data['feedback_type'] = feedback_type
@@ -512,7 +612,8 @@ def validate_feedback_data(data: Dict[str, Any]) -> Dict[str, Any]:
             raise ValidationError("Report reason is required for report feedback")
         validated_data['report_reason'] = validate_choice(
             data['report_reason'],
-            VALID_REPORT_REASONS,
+            _VALID_REPORT_REASONS,
+            _INVALID_REPORT_REASON_MSG,
             "report_reason"
         )
         
@@ -546,17 +647,17 @@ def validate_ip_address(ip_address: str) -> bool:
         return True  # Allow empty IP
     
     # Basic IP format validation
-    ip_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    if not re.match(ip_pattern, ip_address):
+    try:
+        address = IPv4Address(ip_address)
+    except AddressValueError:
         raise ValidationError("Invalid IP address format")
     
-    # Check for suspicious patterns
-    for pattern in SUSPICIOUS_IP_PATTERNS:
-        if re.match(pattern, ip_address):
-            logger.warning(f"Suspicious IP detected: {ip_address}")
-            # Don't raise error for private IPs in development
-            if not getattr(settings, 'DEBUG', False):
-                raise ValidationError("Request from suspicious IP address")
+    # Check for private / loopback addresses
+    if address.is_private or address.is_loopback:
+        logger.warning(f"Suspicious IP detected: {ip_address}")
+        # Don't raise error for private IPs in development
+        if not getattr(settings, 'DEBUG', False):
+            raise ValidationError("Request from suspicious IP address")
     
     return True
 
@@ -583,7 +684,7 @@ def validate_search_query(query: str) -> str:
     )
     
     # Remove potentially dangerous characters
-    query = re.sub(r'[<>"\']', '', query)
+    query = query.translate(_SEARCH_UNSAFE_CHARS_TABLE)
     
     return query
 
@@ -611,6 +712,19 @@ def validate_bulk_operation_data(data: List[Dict[str, Any]], max_items: int = 50
     if len(data) > max_items:
         raise ValidationError(f"Bulk operation limited to {max_items} items")
     
+    # Well-formed batches are coerced in a single comprehension; the
+    # per-item loop only runs to report which item is invalid
+    try:
+        validated_items = [
+            {**item, 'id': int(item['id'])}
+            for item in data
+            if item.__class__ is dict
+        ]
+        if len(validated_items) == len(data):
+            return validated_items
+    except (KeyError, ValueError, TypeError):
+        pass
+    
     validated_items = []
     for i, item in enumerate(data):
         if not isinstance(item, dict):
@@ -621,89 +735,94 @@ def validate_bulk_operation_data(data: List[Dict[str, Any]], max_items: int = 50
             raise ValidationError(f"Item {i} missing required 'id' field")
         
         try:
-            item['id'] = int(item['id'])
+            item_id = int(item['id'])
         except (ValueError, TypeError):
             raise ValidationError(f"Item {i} has invalid 'id' field")
         
-        validated_items.append(item)
+        validated_items.append({**item, 'id': item_id})
     
     return validated_items
 
 
+# (field, validator, keyword arguments) for validate_idea_request_data
+_FIELD_VALIDATORS = (
+    ('title', validate_text_content, {'field_name': 'title', 'min_length': 5, 'max_length': 200}),
+    ('occasion', validate_text_content, {'field_name': 'occasion', 'min_length': 3, 'max_length': 100}),
+    ('partner_interests', validate_interests, {'field_name': 'partner_interests'}),
+    ('user_interests', validate_interests, {'field_name': 'user_interests'}),
+    ('personality_type', validate_choice, {
+        'valid_choices': _VALID_PERSONALITY_TYPES,
+        'invalid_message': _INVALID_PERSONALITY_TYPE_MSG,
+        'field_name': 'personality_type',
+    }),
+    ('budget', validate_choice, {
+        'valid_choices': _VALID_BUDGET,
+        'invalid_message': _INVALID_BUDGET_MSG,
+        'field_name': 'budget',
+    }),
+    ('location_type', validate_choice, {
+        'valid_choices': _VALID_LOCATION_TYPES,
+        'invalid_message': _INVALID_LOCATION_TYPE_MSG,
+        'field_name': 'location_type',
+    }),
+    ('location_city', validate_city_name, {}),
+    ('duration', validate_choice, {
+        'valid_choices': _VALID_DURATION,
+        'invalid_message': _INVALID_DURATION_MSG,
+        'field_name': 'duration',
+    }),
+    ('special_requirements', validate_text_content, {
+        'field_name': 'special_requirements',
+        'min_length': 5,
+        'max_length': MAX_REQUIREMENTS_LENGTH,
+    }),
+    ('custom_prompt', validate_ai_prompt, {}),
+    ('ai_model', validate_ai_model, {}),
+)
+
+# At least one of these must be present in a valid idea request
+_REQUIRED_IDEA_REQUEST_FIELDS = frozenset(('partner_interests', 'user_interests', 'custom_prompt', 'occasion'))
+
+
 # Helper functions
 
+@_memoize_short_text
 def _contains_profanity(text: str) -> bool:
     """Check if text contains profanity"""
-    text_lower = text.lower()
-    for pattern in PROFANITY_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return True
-    return False
+    return _PROFANITY_RE.search(text) is not None
 
 
+@_memoize_short_text
 def _contains_spam_patterns(text: str) -> bool:
     """Check if text contains spam patterns"""
-    for pattern in SPAM_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return (
+        _SPAM_RE.search(text) is not None or
+        _ALL_CAPS_RE.search(text) is not None
+    )
 
 
+@_memoize_short_text
 def _contains_valid_interests(interests: str) -> bool:
     """Check if interests contain valid activity/interest keywords"""
     # Basic validation - could be enhanced with ML or more sophisticated rules
-    valid_keywords = [
-        'music', 'movie', 'book', 'sport', 'food', 'travel', 'art', 'dance',
-        'cook', 'read', 'watch', 'play', 'listen', 'walk', 'run', 'swim',
-        'hiking', 'gaming', 'photography', 'painting', 'writing', 'learning'
-    ]
-    
     interests_lower = interests.lower()
-    return any(keyword in interests_lower for keyword in valid_keywords)
+    
+    if _INTEREST_KEYWORD_AUTOMATON is not None:
+        return next(_INTEREST_KEYWORD_AUTOMATON.iter(interests_lower), None) is not None
+    
+    return _INTEREST_KEYWORD_RE.search(interests_lower) is not None
 
 
+@_memoize_short_text
 def _contains_prompt_injection(prompt: str) -> bool:
     """Check for prompt injection attempts"""
-    injection_patterns = [
-        r'ignore\s+(previous|above|all)\s+instructions',
-        r'system\s*:\s*',
-        r'assistant\s*:\s*',
-        r'human\s*:\s*',
-        r'ai\s*:\s*',
-        r'pretend\s+to\s+be',
-        r'act\s+as\s+if',
-        r'forget\s+everything',
-        r'new\s+instructions',
-        r'override\s+instructions',
-    ]
-    
-    prompt_lower = prompt.lower()
-    for pattern in injection_patterns:
-        if re.search(pattern, prompt_lower):
-            return True
-    
-    return False
+    return _INJECTION_RE.search(prompt) is not None
 
 
+@_memoize_short_text
 def _contains_system_commands(prompt: str) -> bool:
     """Check for system command attempts"""
-    command_patterns = [
-        r'\$\s*\w+',  # Shell variables
-        r';\s*rm\s+',  # Dangerous commands
-        r';\s*del\s+',
-        r';\s*sudo\s+',
-        r'exec\s*\(',
-        r'eval\s*\(',
-        r'__import__',
-        r'subprocess',
-        r'os\.system',
-    ]
-    
-    for pattern in command_patterns:
-        if re.search(pattern, prompt, re.IGNORECASE):
-            return True
-    
-    return False
+    return _COMMAND_RE.search(prompt) is not None
 
 
 def validate_json_data(data: str, max_size: int = 10000) -> Dict[str, Any]:
@@ -727,8 +846,8 @@ def validate_json_data(data: str, max_size: int = 10000) -> Dict[str, Any]:
         raise ValidationError(f"JSON data too large (max {max_size} characters)")
     
     try:
-        parsed_data = json.loads(data)
-    except json.JSONDecodeError as e:
+        parsed_data = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
         raise ValidationError(f"Invalid JSON format: {str(e)}")
     
     return parsed_data
@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django.db.models import Q, Count, Avg, F
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 from django.core.cache import cache
@@ -26,8 +27,8 @@ from .serializers import (
     IdeaCategorySerializer, IdeaTemplateListSerializer, IdeaTemplateDetailSerializer,
     IdeaRequestCreateSerializer, IdeaRequestSerializer, GeneratedIdeaSerializer,
     IdeaFeedbackCreateSerializer, IdeaFeedbackSerializer, IdeaBookmarkCreateSerializer,
-    IdeaBookmarkSerializer, QuickIdeaRequestSerializer, IdeaSearchSerializer,
-    UserIdeaStatsSerializer
+    IdeaBookmarkSerializer, IdeaBookmarkListSerializer, QuickIdeaRequestSerializer,
+    IdeaSearchSerializer, UserIdeaStatsSerializer
 )
 from .services import IdeaGenerationService, IdeaAnalyticsService
 from .tasks import generate_ideas_async, update_usage_stats
@@ -93,9 +94,11 @@ class IdeaTemplateViewSet(viewsets.ReadOnlyModelViewSet):
         
         # Filter by user's subscription tier
         if self.request.user.is_authenticated:
-            return IdeaTemplate.objects.for_user_tier(self.request.user)
+            queryset = IdeaTemplate.objects.for_user_tier(self.request.user)
         else:
-            return queryset.filter(is_premium=False)
+            queryset = queryset.filter(is_premium=False)
+        
+        return queryset.select_related('category')
     
     @action(detail=False, methods=['get'])
     def popular(self, request):
@@ -489,7 +492,7 @@ class GeneratedIdeaViewSet(viewsets.ReadOnlyModelViewSet):
             # Unlike
             existing_like.delete()
             idea.like_count = max(0, idea.like_count - 1)
-            idea.save(update_fields=['like_count'])
+            GeneratedIdea.objects.filter(pk=idea.pk).update(like_count=Greatest(F('like_count') - 1, 0))
             return Response({'liked': False, 'like_count': idea.like_count})
         else:
             # Like
@@ -634,11 +637,21 @@ class IdeaBookmarkViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Get bookmarks for current user only"""
-        return IdeaBookmark.objects.filter(user=self.request.user)
+        queryset = IdeaBookmark.objects.filter(user=self.request.user)
+        
+        if self.action == 'list':
+            # Project only the columns the list needs instead of full instances
+            return queryset.order_by('-created_at').values(
+                *IdeaBookmarkListSerializer.BOOKMARK_LIST_VALUES
+            )
+        
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'create':
             return IdeaBookmarkCreateSerializer
+        if self.action == 'list':
+            return IdeaBookmarkListSerializer
         return IdeaBookmarkSerializer
     
     def create(self, request, *args, **kwargs):
@@ -66,6 +66,7 @@ def clear_user_cache_on_subscription_change(sender, instance, **kwargs):
     cache.delete(f"user_subscription_{instance.user.id}")
     cache.delete(f"user_usage_limits_{instance.user.id}")
     cache.delete(f"user_daily_ideas_{instance.user.id}")
+    cache.delete(f"user_premium_{instance.user.id}")
 
 @receiver(post_save, sender=FlutterwaveTransaction)
 def log_transaction_status_change(sender, instance, created, **kwargs):